@@ -1,46 +0,0 @@
-"""
-Core module for Promptterfly.
-
-Provides access to models, configuration, and exceptions.
-"""
-
-from .models import (
-    ModelConfig,
-    Prompt,
-    Version,
-    ProjectConfig,
-)
-from .config import (
-    load_config,
-    save_config,
-    get_config_dir,
-)
-from .exceptions import (
-    PromptterflyError,
-    PromptNotFound,
-    InvalidConfig,
-    ValidationError,
-    VersionNotFound,
-    ModelNotFound,
-    StorageError,
-)
-
-__all__ = [
-    # Models
-    "ModelConfig",
-    "Prompt",
-    "Version",
-    "ProjectConfig",
-    # Config
-    "load_config",
-    "save_config",
-    "get_config_dir",
-    # Exceptions
-    "PromptterflyError",
-    "PromptNotFound",
-    "InvalidConfig",
-    "ValidationError",
-    "VersionNotFound",
-    "ModelNotFound",
-    "StorageError",
-]
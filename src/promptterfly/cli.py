@@ -1,15 +1,38 @@
 """Promptterfly CLI entry point."""
+import importlib
 import typer
+import click
 from typing import Optional
 from pathlib import Path
-from rich.console import Console
+from typer.core import TyperGroup
 
-app = typer.Typer(help="Promptterfly: Local prompt manager with versioning & optimization")
+# Subcommand groups, imported only when dispatched to (name -> module under promptterfly.commands)
+LAZY_SUBCOMMANDS = {
+    "prompt": "prompt",
+    "version": "version",
+    "optimize": "optimize",
+    "model": "model",
+    "auto": "auto",
+    "dataset": "dataset",
+}
 
-# Import shared helpers from model commands to avoid duplication
-from promptterfly.commands.model import interactive_provider_selection, interactive_model_selection
 
-console = Console()
+class LazyGroup(TyperGroup):
+    """Root command group that imports subcommand modules on first use."""
+
+    def list_commands(self, ctx: click.Context) -> list:
+        return super().list_commands(ctx) + [n for n in LAZY_SUBCOMMANDS if n not in self.commands]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.commands and cmd_name in LAZY_SUBCOMMANDS:
+            module = importlib.import_module(f"promptterfly.commands.{LAZY_SUBCOMMANDS[cmd_name]}")
+            command = typer.main.get_group(module.app)
+            command.name = cmd_name
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+app = typer.Typer(cls=LazyGroup, help="Promptterfly: Local prompt manager with versioning & optimization")
 
 
 @app.command()
@@ -17,17 +40,21 @@ def init(
     path: Path = typer.Option(Path.cwd(), "--path", help="Project directory")
 ):
     """Initialize Promptterfly in the current or specified directory."""
-    from promptterfly.core.config import load_config, save_config, DEFAULT_CONFIG
-    from promptterfly.utils.io import ensure_dir
-    from promptterfly.core.models import ProjectConfig, ModelConfig
+    from rich.console import Console
+    from promptterfly.core.config import save_config, default_config
+    from promptterfly.utils.io import ensure_dir, ensure_line, set_dotenv_var
+    from promptterfly.core.models import ModelConfig
     from promptterfly.models.registry import add_model, set_default
     from promptterfly.utils.io import find_project_root
 
+    console = Console()
     project_root = path.resolve()
     pt_dir = project_root / ".promptterfly"
     ensure_dir(pt_dir)
+    # A parent project may already be memoized for this directory
+    find_project_root.cache_clear()
     # Create default config
-    config = ProjectConfig(**DEFAULT_CONFIG)
+    config = default_config()
     save_config(project_root, config)
     # Create prompts directory
     ensure_dir(pt_dir / "prompts")
@@ -39,6 +66,9 @@ def init(
         console.print("You can add models later with [bold]promptterfly model add[/bold].")
         return
 
+    # Shared helpers from model commands; only needed for the walkthrough
+    from promptterfly.commands.model import interactive_provider_selection, interactive_model_selection
+
     console.print("\n[bold]Configure your first LLM model:[/bold]")
     provider = interactive_provider_selection()
     base_url = None
@@ -75,33 +105,13 @@ def init(
             if key:
                 break
             console.print("[red]API key cannot be empty. Please try again.[/red]")
+        if ensure_line(project_root / ".gitignore", ".env"):
+            console.print("[dim]Added .env to .gitignore[/dim]")
         dotenv_path = project_root / ".env"
-        # Ensure .gitignore has .env
-        gitignore_path = project_root / ".gitignore"
-        entry = ".env"
-        if gitignore_path.exists():
-            lines = gitignore_path.read_text().splitlines()
-            if entry not in lines:
-                with open(gitignore_path, "a") as f:
-                    f.write(f"\n{entry}\n")
-                typer.echo("[dim]Added .env to .gitignore[/dim]")
+        if set_dotenv_var(dotenv_path, api_key_env, key):
+            typer.echo(f"✅ API key saved to {dotenv_path}")
         else:
-            with open(gitignore_path, "w") as f:
-                f.write(f"{entry}\n")
-            typer.echo("[dim]Created .gitignore with .env[/dim]")
-        # Write key to .env
-        if dotenv_path.exists():
-            existing = dotenv_path.read_text()
-            if f"{api_key_env}=" in existing:
-                typer.echo(f"[yellow]{api_key_env} already exists in .env. Skipping.[/yellow]")
-            else:
-                with open(dotenv_path, "a") as f:
-                    f.write(f"\n{api_key_env}={key}\n")
-                typer.echo(f"✅ API key saved to {dotenv_path}")
-        else:
-            with open(dotenv_path, "w") as f:
-                f.write(f"{api_key_env}={key}\n")
-            typer.echo(f"✅ Created .env with API key at {dotenv_path}")
+            console.print(f"[yellow]{api_key_env} already exists in .env. Skipping.[/yellow]")
 
     # Create ModelConfig and add to registry
     model_cfg = ModelConfig(
@@ -122,13 +132,40 @@ def init(
 
 
 @app.command()
-def config():
+def config(
+    fmt: str = typer.Option("yaml", "--format", "-f", help="Output format: yaml or json")
+):
     """Show current configuration."""
-    from promptterfly.core.config import load_config
-    import yaml
+    from promptterfly.core.config import load_config, dump_config
 
+    if fmt not in ("yaml", "json"):
+        typer.echo(f"Unknown format: {fmt} (expected yaml or json)")
+        raise typer.Exit(1)
     cfg = load_config()
-    typer.echo(yaml.dump(cfg.model_dump(mode="json"), sort_keys=False))
+    if fmt == "json":
+        # Serialized directly by pydantic-core
+        typer.echo(cfg.model_dump_json(indent=2))
+    else:
+        typer.echo(dump_config(cfg), nl=False)
+
+
+# Parsers for config_set, keyed by the exact type of the current value
+_COERCERS = {
+    bool: lambda v: v.lower() in ("true", "1", "yes", "on"),
+    int: int,
+    float: float,
+    str: str,
+    # Concrete Path subclass for this platform (PosixPath/WindowsPath)
+    type(Path()): Path,
+}
+
+
+def _parse_config_value(current, value: str):
+    """Parse a config-set string according to the type of the current value.
+
+    Raises ValueError if the string cannot be converted.
+    """
+    return _COERCERS.get(type(current), str)(value)
 
 
 @app.command()
@@ -140,31 +177,17 @@ def config_set(key: str, value: str):
     if not hasattr(cfg, key):
         typer.echo(f"Unknown config key: {key}")
         raise typer.Exit(1)
-    # Try to parse value appropriately
+    # Parse value according to the type of the current setting
     current = getattr(cfg, key)
-    if isinstance(current, bool):
-        parsed = value.lower() in ("true", "1", "yes", "on")
-    elif isinstance(current, int):
-        parsed = int(value)
-    elif isinstance(current, float):
-        parsed = float(value)
-    else:
-        parsed = value
+    try:
+        parsed = _parse_config_value(current, value)
+    except ValueError:
+        typer.echo(f"Invalid {type(current).__name__} for {key}: {value}")
+        raise typer.Exit(1)
     setattr(cfg, key, parsed)
     save_config(Path.cwd(), cfg)
     typer.echo(f"Set {key} = {parsed}")
 
 
-# Import and register subcommands
-from promptterfly.commands import prompt, version, optimize, model, auto, dataset  # noqa: E402
-
-app.add_typer(prompt.app, name="prompt")
-app.add_typer(version.app, name="version")
-app.add_typer(optimize.app, name="optimize")
-app.add_typer(model.app, name="model")
-app.add_typer(auto.app, name="auto")
-app.add_typer(dataset.app, name="dataset")
-
-
 if __name__ == "__main__":
     app()
@@ -1,9 +1,15 @@
 """Auto-evolution commands."""
+import asyncio
+import collections
+import hashlib
+import multiprocessing
 import typer
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Optional
 from promptterfly.storage.prompt_store import PromptStore
 from promptterfly.core.config import load_config
-from promptterfly.models.registry import get_model_by_name
+from promptterfly.models.registry import load_models
 from promptterfly.optimization.engine import optimize as engine_optimize
 from promptterfly.utils.io import find_project_root
 from promptterfly.utils.tui import print_success, print_error
@@ -11,11 +17,71 @@ from promptterfly.utils.tui import print_success, print_error
 app = typer.Typer(help="Auto-evolution commands")
 
 
+def _optimize_prompt(store: PromptStore, prompt, dataset_file: Path, max_iterations: int, use_cache: bool = True) -> str:
+    """Run up to max_iterations optimization passes on one prompt; return its status."""
+    current_prompt = prompt
+    iterations = 0
+    for _ in range(max_iterations):
+        iterations += 1
+        try:
+            new_prompt = engine_optimize(
+                prompt=current_prompt,
+                dataset_path=str(dataset_file),
+                use_cache=use_cache,
+                project_root=store.project_root,
+            )
+            # Avoid duplicate work if unchanged
+            if new_prompt.template == current_prompt.template:
+                typer.echo(f"  {prompt.id}: No change; stopping iterations.")
+                break
+            store.save_prompt(new_prompt)
+            current_prompt = new_prompt
+        except Exception as e:
+            print_error(f"  {prompt.id}: Error: {e}")
+            break
+    return f"optimized ({iterations} iter)"
+
+
+async def _run_concurrently(jobs: list, concurrency: int) -> list:
+    """Run (func, *args) jobs in worker threads, at most `concurrency` at a time.
+
+    Results are returned in job order.
+    """
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def run(job):
+        async with semaphore:
+            return await asyncio.to_thread(*job)
+
+    return await asyncio.gather(*(run(job) for job in jobs))
+
+
+def _template_digest(template: str) -> bytes:
+    """16-byte fingerprint of a template, for cycle detection."""
+    return hashlib.blake2b(template.encode("utf-8"), digest_size=16).digest()
+
+
+def _call_job(job: tuple):
+    """Run a (func, *args) job; module-level so it can be sent to worker processes."""
+    return job[0](*job[1:])
+
+
+def _run_in_processes(jobs: list, processes: int) -> list:
+    """Run (func, *args) jobs across a spawned process pool; results in job order."""
+    # spawn avoids forking a process that may hold threads or open LLM clients
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=processes, mp_context=context) as pool:
+        return list(pool.map(_call_job, jobs))
+
+
 @app.command("optimize-all")
 def auto_optimize_all(
     dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be optimized without applying"),
     max_iterations: int = typer.Option(1, "--max-iter", help="Number of optimization iterations per prompt (overrides dataset few-shot only)"),
-    dataset_path: Optional[Path] = typer.Option(None, "--dataset", help="Dataset file (JSONL). Default: .promptterfly/dataset.jsonl")
+    dataset_path: Optional[Path] = typer.Option(None, "--dataset", help="Dataset file (JSONL). Default: .promptterfly/dataset.jsonl"),
+    concurrency: int = typer.Option(4, "--concurrency", min=1, help="Number of prompts to optimize at the same time"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Ignore previously cached optimization results"),
+    processes: int = typer.Option(0, "--processes", min=0, help="Optimize in N worker processes instead of threads (for CPU-heavy strategies)")
 ):
     """Optimize all prompts using the available dataset. Cost-effective: runs few-shot only."""
     try:
@@ -39,12 +105,16 @@ def auto_optimize_all(
         print_error(f"Dataset not found: {dataset_file}. Generate with 'dataset generate'.")
         raise typer.Exit(1)
 
-    # Pre-load model configuration per prompt or default each time
+    # Config and model registry are constant across the run; read them once
+    default_model = load_config(project_root).default_model
+    models_by_name = {m.name: m for m in load_models(project_root)}
     results = []
+    # (index into results, job) for prompts that need an actual optimization run
+    pending = []
     for p in prompts:
         # Per-prompt model override: check p.model_name (if set)
-        model_name = p.model_name or load_config(project_root).default_model
-        model_cfg = get_model_by_name(model_name, project_root)
+        model_name = p.model_name or default_model
+        model_cfg = models_by_name.get(model_name)
         if not model_cfg:
             print_error(f"Model '{model_name}' for prompt {p.id} not configured. Skipping.")
             results.append((p.id, p.name, "skipped (model)"))
@@ -55,22 +125,20 @@ def auto_optimize_all(
             results.append((p.id, p.name, "dry-run"))
             continue
 
-        # Multiple iterations if requested (simple loop)
-        current_prompt = p
-        for i in range(max_iterations):
-            try:
-                new_prompt = engine_optimize(prompt_id=current_prompt.id, dataset_path=str(dataset_file))
-                # Avoid duplicate work if unchanged
-                if new_prompt.template == current_prompt.template:
-                    typer.echo("  No change; stopping iterations.")
-                    break
-                store.save_prompt(new_prompt)
-                current_prompt = new_prompt
-            except Exception as e:
-                print_error(f"  Error: {e}")
-                break
+        results.append((p.id, p.name, None))
+        pending.append((len(results) - 1, (_optimize_prompt, store, p, dataset_file, max_iterations, not no_cache)))
 
-        results.append((p.id, p.name, f"optimized ({i+1} iter)"))
+    # Prompts are independent and optimization is dominated by LLM round trips,
+    # so overlap them in worker threads (or processes, if requested)
+    if pending:
+        jobs = [job for _, job in pending]
+        if processes:
+            statuses = _run_in_processes(jobs, processes)
+        else:
+            statuses = asyncio.run(_run_concurrently(jobs, concurrency))
+        for (index, _), status in zip(pending, statuses):
+            pid, name, _ = results[index]
+            results[index] = (pid, name, status)
 
     # Summary
     typer.echo("\nOptimization Summary:")
@@ -84,7 +152,9 @@ def auto_optimize_all(
 def bootstrap_iterations(
     dataset: Path = typer.Option(".promptterfly/dataset.jsonl", "--dataset"),
     max_iterations: int = typer.Option(3, "--max-iter", help="Max optimization iterations per prompt"),
-    improvement_threshold: float = typer.Option(0.01, "--threshold", help="Min relative improvement (length ratio) to continue")
+    improvement_threshold: float = typer.Option(0.01, "--threshold", help="Min relative improvement (length ratio) to continue"),
+    patience: int = typer.Option(1, "--patience", min=1, help="Stop after this many consecutive iterations below --threshold"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Ignore previously cached optimization results")
 ):
     """Iteratively optimize prompts until convergence or max iterations."""
     try:
@@ -106,22 +176,40 @@ def bootstrap_iterations(
 
     for p in prompts:
         typer.echo(f"\n[{p.id}] {p.name}")
-        current_template = p.template
+        current_prompt = p
+        # Recent template fingerprints; a repeat means the optimizer is cycling (A -> B -> A)
+        recent = collections.deque([_template_digest(p.template)], maxlen=4)
+        stalled = 0
         for i in range(1, max_iterations+1):
             typer.echo(f"  Iteration {i}...")
             try:
-                new_prompt = engine_optimize(prompt_id=p.id, dataset_path=str(ds_path))
+                new_prompt = engine_optimize(
+                    prompt=current_prompt,
+                    dataset_path=str(ds_path),
+                    use_cache=not no_cache,
+                    project_root=project_root,
+                )
+                current_template = current_prompt.template
                 new_template = new_prompt.template
                 if new_template == current_template:
                     typer.echo("  No change; stopping.")
                     break
+                digest = _template_digest(new_template)
+                if digest in recent:
+                    typer.echo("  Cycle detected (template seen in a recent iteration); stopping.")
+                    break
+                recent.append(digest)
                 # Crude improvement: length delta ratio
                 improvement = abs(len(new_template) - len(current_template)) / max(len(current_template), 1)
-                current_template = new_template
+                current_prompt = new_prompt
                 store.save_prompt(new_prompt)
                 if improvement < improvement_threshold:
-                    typer.echo(f"  Improvement ({improvement:.3f}) below threshold; stopping.")
-                    break
+                    stalled += 1
+                    if stalled >= patience:
+                        typer.echo(f"  Improvement ({improvement:.3f}) below threshold; stopping.")
+                        break
+                else:
+                    stalled = 0
             except Exception as e:
                 print_error(f"  Error: {e}")
                 break
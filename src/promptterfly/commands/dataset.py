@@ -2,22 +2,121 @@
 import typer
 import os
 import json
+import hashlib
+import math
+import asyncio
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set, Tuple
 from promptterfly.utils.io import find_project_root
-from promptterfly.utils.tui import print_success, print_error
+from promptterfly.utils.tui import print_success, print_error, print_warning
 from promptterfly.core.config import load_config
-from promptterfly.models.registry import get_model_by_name
+from promptterfly.models.registry import get_model_by_name, litellm_model_str
 
 app = typer.Typer(help="Dataset management for optimization")
 
 
+def _line_digest(line: bytes) -> bytes:
+    """16-byte fingerprint of one serialized dataset record."""
+    return hashlib.blake2b(line.strip(), digest_size=16).digest()
+
+
+def _scan_dataset(path: Path) -> Tuple[int, Set[bytes]]:
+    """Return the number of records in a JSONL file and their fingerprints.
+
+    Works on raw bytes; records are not JSON-decoded.
+    """
+    count = 0
+    digests = set()
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                count += 1
+                digests.add(_line_digest(line))
+    return count, digests
+
+
+def _generation_prompt(template: str, count: int) -> str:
+    """Build the meta-prompt asking the model for `count` examples."""
+    return f"""Given the following instruction/template, generate {count} diverse input-output pairs that would be useful for fine-tuning.
+
+Instruction: {template}
+
+For each example, output a JSON object with keys 'input' (the user query) and 'completion' (the ideal assistant response). Output one JSON per line, no extra text."""
+
+
+def _single_example_prompt(template: str) -> str:
+    """Build the meta-prompt asking the model for exactly one example."""
+    return f"""Given the following instruction/template, generate one input-output pair that would be useful for fine-tuning.
+
+Instruction: {template}
+
+Output a single JSON object with keys 'input' (the user query) and 'completion' (the ideal assistant response), no extra text."""
+
+
+def _compact_json(text: str) -> str:
+    """Re-serialize a JSON completion onto one line; empty string if invalid."""
+    try:
+        return json.dumps(json.loads(text))
+    except json.JSONDecodeError:
+        return ""
+
+
+async def _generate_batches(
+    model_str: str,
+    template: str,
+    count: int,
+    batch_size: int,
+    concurrency: int,
+    sample_n: bool = False,
+) -> list:
+    """Request `count` examples as ceil(count / batch_size) concurrent completions.
+
+    With sample_n, each request asks for one example and samples `n` choices
+    (decoded in parallel by providers that support it) instead of asking for
+    several examples in one long output.
+
+    Returns one entry per batch: JSONL response text, or the exception raised.
+    """
+    import litellm
+
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+    batches = math.ceil(count / batch_size)
+
+    async def request(n: int):
+        async with semaphore:
+            if sample_n:
+                response = await litellm.acompletion(
+                    model=model_str,
+                    messages=[{"role": "user", "content": _single_example_prompt(template)}],
+                    temperature=0.8,
+                    max_tokens=256,
+                    n=n,
+                )
+                # content is None for refusals/tool calls; skip those choices, not the batch
+                lines = (_compact_json((c.message.content or "").strip()) for c in response.choices)
+                return "\n".join(line for line in lines if line)
+            response = await litellm.acompletion(
+                model=model_str,
+                messages=[{"role": "user", "content": _generation_prompt(template, n)}],
+                temperature=0.8,
+                max_tokens=1024,
+                n=1,
+            )
+            return (response.choices[0].message.content or "").strip()
+
+    sizes = [min(batch_size, count - i * batch_size) for i in range(batches)]
+    return await asyncio.gather(*(request(n) for n in sizes), return_exceptions=True)
+
+
 @app.command("generate")
 def generate(
-    count: int = typer.Option(10, "--count", "-n", help="Number of examples to generate"),
+    count: int = typer.Option(10, "--count", "-n", min=1, help="Number of examples to generate"),
     prompt_id: Optional[int] = typer.Option(None, "--prompt-id", help="Prompt ID to base generation on (uses template as instruction)"),
     output: Path = typer.Option(".promptterfly/dataset.jsonl", "--output", help="Output dataset path (appended)"),
-    model_name: Optional[str] = typer.Option(None, "--model", help="Override default model for generation")
+    model_name: Optional[str] = typer.Option(None, "--model", help="Override default model for generation"),
+    batch_size: int = typer.Option(5, "--batch-size", min=1, help="Examples requested per LLM call"),
+    concurrency: int = typer.Option(4, "--concurrency", min=1, help="Maximum concurrent LLM calls"),
+    sample_n: bool = typer.Option(False, "--sample-n", help="Ask for one example per choice and sample --batch-size choices per call (provider must support n)")
 ):
     """Generate synthetic few-shot examples using the configured LLM."""
     try:
@@ -49,13 +148,6 @@ def generate(
             print_error(f"Prompt {prompt_id} not found.")
             raise typer.Exit(1)
 
-    # Build generation meta-prompt
-    gen_prompt = f"""Given the following instruction/template, generate {count} diverse input-output pairs that would be useful for fine-tuning.
-
-Instruction: {template}
-
-For each example, output a JSON object with keys 'input' (the user query) and 'completion' (the ideal assistant response). Output one JSON per line, no extra text."""
-
     # Set up environment for API key if needed
     if model_cfg.api_key_env:
         api_key = os.getenv(model_cfg.api_key_env)
@@ -63,37 +155,36 @@ For each example, output a JSON object with keys 'input' (the user query) and 'c
             print_error(f"API key environment variable {model_cfg.api_key_env} not set.")
             raise typer.Exit(1)
 
-    # Prepare litellm model string
-    if model_cfg.provider == "openai":
-        model_str = f"openai/{model_cfg.model}"
-    elif model_cfg.provider == "anthropic":
-        model_str = f"anthropic/{model_cfg.model}"
-    else:
-        model_str = model_cfg.model
+    model_str = litellm_model_str(model_cfg.provider, model_cfg.model)
 
-    try:
-        import litellm
-        responses = litellm.completion(
-            model=model_str,
-            messages=[{"role": "user", "content": gen_prompt}],
-            temperature=0.8,
-            max_tokens=1024,
-            n=1,
-        )
-        text = responses.choices[0].message.content.strip()
-    except Exception as e:
-        print_error(f"LLM call failed: {e}")
+    # Small batches avoid truncated output and run concurrently
+    texts = asyncio.run(_generate_batches(model_str, template, count, batch_size, concurrency, sample_n))
+    errors = [t for t in texts if isinstance(t, BaseException)]
+    if len(errors) == len(texts):
+        print_error(f"LLM call failed: {errors[0]}")
         raise typer.Exit(1)
+    if errors:
+        print_warning(f"{len(errors)} of {len(texts)} batches failed; first error: {errors[0]}")
 
-    # Parse JSON lines
+    # Parse JSON lines, dropping duplicates across batches
     examples = []
-    for line in text.splitlines():
-        try:
-            obj = json.loads(line)
-            if "input" in obj and "completion" in obj:
-                examples.append(obj)
-        except json.JSONDecodeError:
+    seen = set()
+    for text in texts:
+        if isinstance(text, BaseException):
             continue
+        for line in text.splitlines():
+            # Cheap substring check skips prose/junk lines without a failed parse
+            if '"input"' not in line or '"completion"' not in line:
+                continue
+            try:
+                obj = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(obj, dict) and "input" in obj and "completion" in obj:
+                key = json.dumps([obj["input"], obj["completion"]])
+                if key not in seen:
+                    seen.add(key)
+                    examples.append(obj)
 
     if not examples:
         print_error("No valid examples generated.")
@@ -102,11 +193,25 @@ For each example, output a JSON object with keys 'input' (the user query) and 'c
     # Append to dataset file
     output_path = project_root / output
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    existing = 0
+    existing, existing_digests = 0, set()
     if output_path.exists():
-        existing = sum(1 for _ in open(output_path))
-    with open(output_path, "a") as f:
-        for ex in examples[:count]:
-            f.write(json.dumps(ex) + "\n")
+        existing, existing_digests = _scan_dataset(output_path)
+    # Skip records already in the dataset (compared by serialized line)
+    lines = []
+    for ex in examples:
+        line = json.dumps(ex).encode("utf-8")
+        digest = _line_digest(line)
+        if digest not in existing_digests:
+            existing_digests.add(digest)
+            lines.append(line)
+    lines = lines[:count]
+    if not lines:
+        print_error("No new examples generated; all are already in the dataset.")
+        raise typer.Exit(1)
+    # One encoded buffer, one write
+    with open(output_path, "ab") as f:
+        f.write(b"".join(line + b"\n" for line in lines))
 
-    print_success(f"Generated {len(examples[:count])} examples → {output} (total now ~{existing + len(examples[:count])})")
+    if len(lines) < count:
+        print_warning(f"Only {len(lines)} of {count} requested examples were generated.")
+    print_success(f"Generated {len(lines)} examples → {output} (total now {existing + len(lines)})")
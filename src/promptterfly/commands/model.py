@@ -1,20 +1,21 @@
 """Model management commands: list, add, remove, set-default."""
+import functools
+import re
+import shutil
+from operator import attrgetter
 import typer
 from pathlib import Path
-from typing import List, Optional
-from rich.console import Console
-from rich.prompt import Prompt, Confirm
+from typing import Optional
 from promptterfly.core.models import ModelConfig
 from promptterfly.models.registry import (
     load_models,
     add_model,
     remove_model,
     set_default,
-    get_model_by_name,
 )
-from promptterfly.utils.tui import print_table, print_success, print_error
-
-console = Console()
+from promptterfly.utils.io import ensure_line, set_dotenv_var
+from promptterfly.utils.model_catalog import load_catalog
+from promptterfly.utils.tui import console, print_table, print_success, print_error
 
 # A small curated list of well-known providers (used for provider selection)
 COMMON_PROVIDERS = [
@@ -22,12 +23,35 @@ COMMON_PROVIDERS = [
     "groq", "grok", "openrouter", "together", "anyscale", "local"
 ]
 
-# For local providers, we don't predefine model names; user types them.
-# For cloud providers we fetch live from litellm in interactive_model_selection.
-# (This dict retained only for possible fallback if needed; keep local empty.)
-DEFAULT_PROVIDER_MODELS = {
-    "local": [],
-}
+# Model names for cloud providers come from the litellm-derived catalog
+# (utils.model_catalog); for local providers the user types them.
+
+# Case-insensitive lookup for typed provider names
+_PROVIDER_MAP_LC = {p.lower(): p for p in COMMON_PROVIDERS}
+
+
+# Model-name hints for infer_provider, in priority order. A hint matches
+# anywhere in the name unless it starts with "^" (prefix only).
+_PROVIDER_HINTS = (
+    ("openai", ("gpt", "^text-")),
+    ("anthropic", ("claude",)),
+    ("google", ("gemini",)),
+    ("mistral", ("mistral",)),
+    ("cohere", ("command",)),
+)
+
+
+def _hint_regex(hint: str) -> str:
+    """Translate a provider hint into a regex anchored at the string start."""
+    return re.escape(hint[1:]) if hint.startswith("^") else ".*" + re.escape(hint)
+
+
+# One alternation tried from the start of the string; the named group that
+# matches is the provider, so earlier providers win
+_PROVIDER_PATTERN = re.compile("|".join(
+    f"(?P<{provider}>{'|'.join(map(_hint_regex, hints))})"
+    for provider, hints in _PROVIDER_HINTS
+))
 
 
 def infer_provider(model_str: str) -> Optional[str]:
@@ -35,35 +59,28 @@ def infer_provider(model_str: str) -> Optional[str]:
     model_str = model_str.strip().lower()
     # If it contains a slash, treat the part before slash as provider
     if "/" in model_str:
-        provider = model_str.split("/", 1)[0]
-        # Return provider and also clean model? We'll handle in calling code.
-        return provider
-    if "gpt" in model_str or "chatgpt" in model_str or model_str.startswith("text-"):
-        return "openai"
-    if "claude" in model_str:
-        return "anthropic"
-    if "gemini" in model_str:
-        return "google"
-    if "mistral" in model_str:
-        return "mistral"
-    if "command" in model_str:
-        return "cohere"
-    # Add more as needed
-    return None
+        return model_str.split("/", 1)[0]
+    match = _PROVIDER_PATTERN.match(model_str)
+    return match.lastgroup if match else None
+
+
+def _menu_size(limit: int) -> int:
+    """Number of numbered menu entries to show, capped to fit the terminal."""
+    # Leave room for the heading, the "... more" line and the prompt
+    return max(3, min(limit, shutil.get_terminal_size((80, 24)).lines - 6))
 
 
 def interactive_provider_selection() -> str:
     """Interactively select a provider from available options."""
     providers = COMMON_PROVIDERS
-    # Build case-insensitive mapping for provider names (full set)
-    provider_map = {p.lower(): p for p in providers}
-    # Truncate display to first 10 providers
-    display_providers = providers[:10]
+    provider_map = _PROVIDER_MAP_LC
+    # Truncate display to first 10 providers (fewer on short terminals)
+    display_providers = providers[:_menu_size(10)]
     console.print("[bold]Available providers:[/bold]")
     for i, p in enumerate(display_providers, 1):
         console.print(f"  {i}) {p}")
-    if len(providers) > 10:
-        console.print(f"  ... and {len(providers)-10} more. You can also type any provider name.")
+    if len(providers) > len(display_providers):
+        console.print(f"  ... and {len(providers)-len(display_providers)} more. You can also type any provider name.")
     while True:
         choice = typer.prompt("Select provider by number or type name")
         choice = choice.strip()
@@ -84,34 +101,23 @@ def interactive_provider_selection() -> str:
                 console.print(f"[yellow]Invalid provider '{choice}'. Please select a valid provider from the list.[/yellow]")
 
 
+@functools.lru_cache(maxsize=None)
+def _get_models(provider: str) -> tuple:
+    """Return the sorted model names known for a provider.
+
+    Served from the on-disk model catalog so litellm is not imported on
+    the interactive path; looked up once per provider and process.
+    """
+    return tuple(load_catalog().get(provider, ()))
+
+
 def interactive_model_selection(provider: str) -> str:
     """Interactively select a model from the given provider's offerings."""
-    models = []
-    try:
-        from litellm import model_list
-        if isinstance(model_list, dict):
-            if provider in model_list:
-                models = model_list[provider] or []
-                # Strip any provider prefixes that might be included
-                models = [m.split("/", 1)[-1] if isinstance(m, str) and "/" in m else m for m in models]
-        elif isinstance(model_list, list):
-            prefix = provider + "/"
-            models = []
-            for m in model_list:
-                if isinstance(m, str):
-                    if m.startswith(prefix):
-                        models.append(m.split("/", 1)[1])
-                    # Also include un-prefixed models? Possibly ignore; only take prefixed ones.
-        else:
-            pass
-    except ImportError:
-        pass
-
+    models = _get_models(provider)
     if not models:
         return typer.prompt("Enter model identifier")
 
-    models = sorted(set(models))
-    max_show = 5
+    max_show = _menu_size(5)
     console.print(f"[bold]Available models for {provider}:[/bold]")
     for i, m in enumerate(models[:max_show], 1):
         console.print(f"  {i}) {m}")
@@ -136,22 +142,15 @@ def interactive_model_selection(provider: str) -> str:
 
 def ensure_dotenv_gitignore(project_root: Path):
     """Make sure .env is listed in .gitignore."""
-    gitignore_path = project_root / ".gitignore"
-    entry = ".env"
-    if gitignore_path.exists():
-        lines = [line.strip() for line in gitignore_path.read_text(encoding="utf-8").splitlines()]
-        if entry not in lines:
-            with open(gitignore_path, "a", encoding="utf-8") as f:
-                f.write(f"\n{entry}\n")
-            console.print("[dim]Added .env to .gitignore[/dim]")
-    else:
-        with open(gitignore_path, "w", encoding="utf-8") as f:
-            f.write(f"{entry}\n")
-        console.print("[dim]Created .gitignore with .env[/dim]")
+    if ensure_line(project_root / ".gitignore", ".env"):
+        console.print("[dim]Added .env to .gitignore[/dim]")
 
 
 app = typer.Typer(help="Manage LLM models in the registry")
 
+# Columns shown by 'model list', in table order
+_ROW_FIELDS = attrgetter("name", "provider", "model", "api_key_env", "temperature", "max_tokens")
+
 
 @app.command("list")
 def list_models():
@@ -168,18 +167,12 @@ def list_models():
         typer.echo("No models configured. Use 'promptterfly model add' to add one.")
         return
 
-    rows = []
-    for m in models:
-        default_marker = "(default)" if m.name == get_default_model_name(project_root) else ""
-        rows.append([
-            m.name,
-            m.provider,
-            m.model,
-            m.api_key_env or "-",
-            f"{m.temperature:.2f}",
-            str(m.max_tokens),
-            default_marker
-        ])
+    default_name = get_default_model_name(project_root)
+    rows = [
+        [name, provider, model, api_key_env or "-", f"{temperature:.2f}", str(max_tokens),
+         "(default)" if name == default_name else ""]
+        for name, provider, model, api_key_env, temperature, max_tokens in map(_ROW_FIELDS, models)
+    ]
     print_table(
         ["Name", "Provider", "Model", "API Key Env", "Temp", "Max Tokens", ""],
         rows,
@@ -270,19 +263,10 @@ def add_model_cmd(
             console.print("[red]API key cannot be empty. Please try again.[/red]")
         dotenv_path = project_root / ".env"
         ensure_dotenv_gitignore(project_root)
-        if dotenv_path.exists():
-            existing = dotenv_path.read_text(encoding="utf-8")
-            lines = existing.splitlines()
-            if any(line.strip().startswith(f"{final_api_key_env}=") for line in lines):
-                console.print(f"[yellow]{final_api_key_env} already exists in .env. Skipping.[/yellow]")
-            else:
-                with open(dotenv_path, "a", encoding="utf-8") as f:
-                    f.write(f"\n{final_api_key_env}={key}\n")
-                console.print(f"✅ API key saved to {dotenv_path}")
+        if set_dotenv_var(dotenv_path, final_api_key_env, key):
+            console.print(f"✅ API key saved to {dotenv_path}")
         else:
-            with open(dotenv_path, "w", encoding="utf-8") as f:
-                f.write(f"{final_api_key_env}={key}\n")
-            console.print(f"✅ Created .env with API key at {dotenv_path}")
+            console.print(f"[yellow]{final_api_key_env} already exists in .env. Skipping.[/yellow]")
 
     # Handle local provider base URL if not provided
     final_base_url = base_url
@@ -345,12 +329,7 @@ def set_default_cmd(name: str = typer.Argument(..., help="Model name to set as d
         print_error("Not in a Promptterfly project. Run 'promptterfly init' first.")
         raise typer.Exit(1)
 
-    # Verify model exists
-    model = get_model_by_name(name, project_root)
-    if model is None:
-        print_error(f"Model '{name}' not found in registry")
-        raise typer.Exit(1)
-
+    # set_default verifies the model exists against the same cached registry
     try:
         set_default(name, project_root)
         print_success(f"Default model set to '{name}'")
@@ -1,10 +1,10 @@
 """Optimization commands."""
+import importlib.util
 import typer
 from pathlib import Path
 from typing import Optional
 
 from promptterfly.storage.prompt_store import PromptStore
-from promptterfly.storage.version_store import VersionStore
 from promptterfly.utils.io import find_project_root
 from promptterfly.utils.tui import print_success, print_error
 from promptterfly.utils.loader import spiky_loading
@@ -16,7 +16,8 @@ app = typer.Typer(help="Optimize prompts")
 def improve(
     prompt_id: int,
     strategy: str = typer.Option("few_shot", "--strategy", help="Optimization strategy (default: few_shot)"),
-    dataset: Optional[Path] = typer.Option(None, "--dataset", help="Path to dataset JSONL file")
+    dataset: Optional[Path] = typer.Option(None, "--dataset", help="Path to dataset JSONL file"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Ignore previously cached optimization results")
 ):
     """Improve a prompt using the specified optimization strategy.
 
@@ -31,39 +32,44 @@ def improve(
         raise typer.Exit(1)
 
     store = PromptStore(project_root)
-    vs = VersionStore(project_root)
 
     # Verify prompt exists
     try:
-        store.load_prompt(prompt_id)
+        prompt = store.load_prompt(prompt_id)
     except FileNotFoundError:
         print_error(f"Prompt '{prompt_id}' not found.")
         raise typer.Exit(1)
 
-    # Create snapshot of current prompt before optimization (auto-version)
+    # Create snapshot of current prompt before optimization (auto-version);
+    # re-running on an unchanged prompt reuses the latest snapshot
     try:
-        store.create_snapshot(prompt_id, message=f"Before optimization: strategy={strategy}")
+        version_num = store.create_snapshot(
+            prompt_id,
+            message=f"Before optimization: strategy={strategy}",
+            prompt=prompt,
+            skip_unchanged=True,
+        )
     except Exception as e:
         print_error(f"Failed to create version snapshot: {e}")
         raise typer.Exit(1)
 
-    # Determine the version number we just created
-    versions = vs.list_versions(prompt_id)
-    version_num = versions[-1].version if versions else None
+    # Strategies import dspy lazily; check for it up front for a clear error,
+    # without importing it (a cached result never needs it)
+    if importlib.util.find_spec("dspy") is None:
+        print_error("DSPy is not installed. Optimization requires dspy. Please install dependencies: pip install dspy.")
+        raise typer.Exit(1)
+    from promptterfly.optimization.engine import optimize as engine_optimize
 
     # Run optimization with loading animation
-    try:
-        from promptterfly.optimization.engine import optimize as engine_optimize
-    except ImportError as e:
-        print_error(f"DSPy is not installed. Optimization requires dspy. Please install dependencies: pip install dspy. Details: {e}")
-        raise typer.Exit(1)
 
     try:
         with spiky_loading("Optimizing prompt with DSPy..."):
             new_prompt = engine_optimize(
-                prompt_id=prompt_id,
+                prompt=prompt,
                 strategy=strategy,
-                dataset_path=str(dataset) if dataset else None
+                dataset_path=str(dataset) if dataset else None,
+                use_cache=not no_cache,
+                project_root=project_root
             )
     except Exception as e:
         print_error(f"Optimization failed: {e}")
@@ -77,7 +83,4 @@ def improve(
         raise typer.Exit(1)
 
     # Output success
-    if version_num is not None:
-        print_success(f"Optimization complete. New version: v{version_num}")
-    else:
-        print_success("Optimization complete.")
+    print_success(f"Optimization complete. New version: v{version_num}")
@@ -1,12 +1,15 @@
 """Prompt management commands."""
+import functools
+import heapq
+import sys
 import typer
 import re
-from typing import Optional
+from typing import List, Optional
 from pathlib import Path
 from promptterfly.core.models import Prompt
 from promptterfly.storage.prompt_store import PromptStore
 from promptterfly.utils.io import find_project_root
-from promptterfly.utils.tui import print_table, print_success, print_error
+from promptterfly.utils.tui import print_table, print_success, print_error, format_datetime
 from datetime import datetime
 
 app = typer.Typer(help="Manage prompts")
@@ -14,11 +17,19 @@ app = typer.Typer(help="Manage prompts")
 
 # Removed random ID generation; now using sequential integers via store._next_id()
 
-def _tokenize(s: str) -> set:
-    """Extract lowercase alphanumeric words from a string."""
-    return set(re.findall(r'\b\w+\b', s.lower()))
+_WORD_PATTERN = re.compile(r'\b\w+\b')
 
-def _score_prompt(query: str, prompt: Prompt) -> float:
+
+@functools.lru_cache(maxsize=1024)
+def _tokenize(s: str) -> frozenset:
+    """Extract lowercase alphanumeric words from a string.
+
+    Memoized so repeated searches in one process (e.g. the REPL) reuse
+    each prompt's token sets; frozen because the result is shared.
+    """
+    return frozenset(_WORD_PATTERN.findall(s.lower()))
+
+def _score_prompt(query: str, prompt: Prompt, q_tokens: Optional[frozenset] = None) -> float:
     """
     Compute a weighted match score between query and a prompt.
     - Exact name match: 1.0
@@ -26,8 +37,10 @@ def _score_prompt(query: str, prompt: Prompt) -> float:
     - Description tokens: 0.3 * (overlap fraction)
     - Template tokens (≥2 matches): 0.05 * (overlap fraction) * 2^(count-1)
     Scores are capped at 1.0.
+    Pass q_tokens (the query's _tokenize result) when scoring many prompts.
     """
-    q_tokens = _tokenize(query)
+    if q_tokens is None:
+        q_tokens = _tokenize(query)
     if not q_tokens:
         return 0.0
     len_q = len(q_tokens)
@@ -46,14 +59,18 @@ def _score_prompt(query: str, prompt: Prompt) -> float:
     desc_match = len(q_tokens & desc_tokens)
     score_desc = (desc_match / len_q) * 0.3
 
-    # Template score: only if at least 2 matching words
-    template_tokens = _tokenize(prompt.template)
-    temp_match = len(q_tokens & template_tokens)
+    # Template score: only if at least 2 matching words, so a one-word
+    # query never needs the (possibly long) template tokenized
     score_temp = 0.0
-    if temp_match >= 2:
-        base = (temp_match / len_q) * 0.05
-        exponential = 2 ** (temp_match - 1)
-        score_temp = base * exponential
+    if len_q >= 2:
+        temp_match = len(q_tokens & _tokenize(prompt.template))
+        if temp_match >= 2:
+            base = (temp_match / len_q) * 0.05
+            # The total is capped at 1.0 and base >= 0.1 / len_q, so beyond
+            # 2**64 the product is saturated; clamping also avoids the
+            # OverflowError float(2**1024) would raise for huge queries
+            exponential = 1 << min(temp_match - 1, 64)
+            score_temp = base * exponential
 
     total = score_name + score_desc + score_temp
     return min(total, 1.0)
@@ -69,18 +86,49 @@ def _get_store():
     return PromptStore(project_root)
 
 
-@app.command()
-def list():
-    """List all prompts."""
-    store = _get_store()
-    prompts = store.list_prompts()
+def _unique_name(name: str, existing_names: set) -> str:
+    """Return name, or name_N with N one past the highest existing suffix."""
+    if name not in existing_names:
+        return name
+    # The bare name counts as suffix 1, so the first duplicate becomes name_2
+    pattern = re.compile(rf"{re.escape(name)}(?:_(\d+))?")
+    highest = max(
+        int(m.group(1) or 1)
+        for m in map(pattern.fullmatch, existing_names)
+        if m is not None
+    )
+    return f"{name}_{highest + 1}"
+
+
+def _read_template() -> str:
+    """Read a template from stdin until EOF (Ctrl+D), stripped."""
+    if not sys.stdin.isatty():
+        # Piped input: take the rest of the stream in one read
+        return sys.stdin.read().strip()
+    lines = []
+    try:
+        while True:
+            lines.append(input())
+    except EOFError:
+        pass
+    return "\n".join(lines).strip()
+
+
+def _print_prompts(prompts: List[Prompt]) -> None:
+    """Print the prompt listing table."""
     rows = []
     for p in prompts:
         tags_str = ", ".join(p.tags) if p.tags else "-"
-        rows.append([p.id, p.name, tags_str, p.updated_at.strftime("%Y-%m-%d %H:%M")])
+        rows.append([p.id, p.name, tags_str, format_datetime(p.updated_at)])
     print_table(["ID", "Name", "Tags", "Updated"], rows, title="Prompts")
 
 
+@app.command()
+def list():
+    """List all prompts."""
+    _print_prompts(_get_store().list_prompts())
+
+
 @app.command()
 def show(prompt_id: int):
     """Show prompt details."""
@@ -112,26 +160,17 @@ def create():
     tags = [t.strip() for t in tags_input.split(",") if t.strip()]
     store = _get_store()
     # Ensure unique name (auto-append _N if duplicate)
-    existing_names = {p.name for p in store.list_prompts()}
-    base_name = name
-    counter = 1
-    while name in existing_names:
-        counter += 1
-        name = f"{base_name}_{counter}"
-    if counter > 1:
+    existing = store.list_prompts()
+    existing_names = {p.name for p in existing}
+    unique = _unique_name(name, existing_names)
+    if unique != name:
+        name = unique
         typer.echo(f"Name already exists, using '{name}' instead.")
     typer.echo("\nEnter template (use {variables} for formatting).")
     typer.echo("Variables are supplied at render time via a JSON file.")
     typer.echo("--- begin template ---")
-    lines = []
-    try:
-        while True:
-            line = input()
-            lines.append(line)
-    except EOFError:
-        pass
+    template = _read_template()
     typer.echo("--- end template ---")
-    template = "\n".join(lines).strip()
     if not template:
         print_error("Template cannot be empty")
         raise typer.Exit(1)
@@ -158,13 +197,13 @@ def create():
         auto_version = True
     if auto_version:
         try:
-            store.create_snapshot(prompt_id, message="Initial version (auto)")
+            store.create_snapshot(prompt_id, message="Initial version (auto)", prompt=prompt)
         except Exception as e:
             # Don't fail creation if versioning fails
             typer.echo(f"[dim]Note: failed to create auto-version: {e}[/dim]")
     print_success(f"Created prompt {prompt_id}: {name}")
-    # Auto-list to show the new prompt
-    list()
+    # Auto-list to show the new prompt; it is the most recently updated
+    _print_prompts([prompt] + existing)
 
 
 @app.command()
@@ -186,7 +225,7 @@ def update(prompt_id: int):
         auto_version = True
     if auto_version:
         try:
-            store.create_snapshot(prompt_id, message="Before update")
+            store.create_snapshot(prompt_id, message="Before update", prompt=p)
         except Exception as e:
             # Don't block update if versioning fails
             typer.echo(f"[dim]Warning: failed to create version snapshot: {e}[/dim]")
@@ -199,24 +238,14 @@ def update(prompt_id: int):
     tags = [t.strip() for t in tags_input.split(",") if t.strip()] if tags_input else p.tags
     # Ensure name uniqueness (exclude current prompt)
     existing_names = {other.name for other in store.list_prompts() if other.id != p.id}
-    base_name = name
-    counter = 1
-    while name in existing_names:
-        counter += 1
-        name = f"{base_name}_{counter}"
-    if counter > 1:
+    unique = _unique_name(name, existing_names)
+    if unique != name:
+        name = unique
         typer.echo(f"Name conflicts with existing prompt, using '{name}' instead.")
     typer.echo("Enter new template (Ctrl+D to keep current).")
     typer.echo("--- begin template ---")
-    lines = []
-    try:
-        while True:
-            line = input()
-            lines.append(line)
-    except EOFError:
-        pass
+    template_input = _read_template()
     typer.echo("--- end template ---")
-    template_input = "\n".join(lines).strip()
     new_template = template_input if template_input else p.template
     p.name = name
     p.description = description or None
@@ -232,7 +261,7 @@ def update(prompt_id: int):
             if ds_path.exists():
                 typer.echo("Auto-optimizing with new changes...")
                 from promptterfly.optimization.engine import optimize
-                new_prompt = optimize(prompt_id=prompt_id, dataset_path=str(ds_path))
+                new_prompt = optimize(prompt=p, dataset_path=str(ds_path))
                 store.save_prompt(new_prompt)
                 typer.echo("Auto-optimized prompt updated.")
     except Exception as e:
@@ -244,9 +273,7 @@ def update(prompt_id: int):
 def delete(prompt_id: int):
     """Delete a prompt."""
     store = _get_store()
-    try:
-        store.load_prompt(prompt_id)
-    except FileNotFoundError:
+    if not store.prompt_exists(prompt_id):
         print_error(f"Prompt not found: {prompt_id}")
         raise typer.Exit(1)
     confirm = typer.confirm(f"Delete prompt {prompt_id} and all its versions?")
@@ -269,8 +296,8 @@ def render(prompt_id: int, vars_file: Optional[Path] = typer.Argument(None)):
         raise typer.Exit(1)
     vars_dict = {}
     if vars_file:
-        with open(vars_file) as f:
-            vars_dict = json.load(f)
+        # Bytes go straight to the parser, which detects UTF-8/16/32 itself
+        vars_dict = json.loads(vars_file.read_bytes())
     try:
         rendered = p.render(**vars_dict)
     except KeyError as e:
@@ -297,14 +324,19 @@ def find(query: str):
         print_error("No prompts found.")
         raise typer.Exit(1)
 
-    # Score each prompt
+    # Score each prompt; the query is tokenized once for all of them
+    q_tokens = _tokenize(query)
     scored = []
     for p in prompts:
-        score = _score_prompt(query, p)
+        score = _score_prompt(query, p, q_tokens)
+        if score >= 1.0:
+            # A perfect score (e.g. exact name) would sort first anyway; skip the rest
+            scored = [(score, p)]
+            break
         scored.append((score, p))
 
-    # Sort descending by score
-    scored.sort(key=lambda x: x[0], reverse=True)
+    # Only the top 3 are ever shown; nlargest keeps sorted()'s tie order
+    scored = heapq.nlargest(3, scored, key=lambda x: x[0])
     top_score, top_prompt = scored[0]
 
     # If confident enough, auto-select and show details
@@ -1,18 +1,17 @@
 """Version commands: history, restore."""
 import typer
-from typing import Optional
 from datetime import datetime
 from promptterfly.storage.version_store import VersionStore
 from promptterfly.storage.prompt_store import PromptStore
 from promptterfly.utils.io import find_project_root
-from promptterfly.utils.tui import print_table, print_success, print_error, print_warning
+from promptterfly.utils.tui import print_table, print_success, print_error, print_warning, format_datetime
 
 app = typer.Typer(help="Manage prompt version history")
 
 
 def _format_datetime(dt: datetime) -> str:
     """Format datetime for display."""
-    return dt.strftime("%Y-%m-%d %H:%M:%S")
+    return format_datetime(dt, seconds=True)
 
 
 @app.command("history")
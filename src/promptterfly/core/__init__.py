@@ -1,11 +1,12 @@
 """Core package."""
-from .models import ModelConfig, Prompt, Version, ProjectConfig
+from .models import ModelConfig, Prompt, PromptListAdapter, Version, ProjectConfig
 from .config import load_config, save_config
 from .exceptions import PromptterflyError, PromptNotFound, InvalidConfig
 
 __all__ = [
     "ModelConfig",
     "Prompt",
+    "PromptListAdapter",
     "Version",
     "ProjectConfig",
     "load_config",
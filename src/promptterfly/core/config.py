@@ -1,10 +1,13 @@
 """Configuration loader and manager."""
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 import yaml
+from pydantic import ValidationError
 from .models import ProjectConfig
+from .exceptions import InvalidConfig
 from ..utils.io import find_project_root, ensure_dir, atomic_write
+from ..utils.io import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
 
 
 DEFAULT_CONFIG = {
@@ -14,32 +17,76 @@ DEFAULT_CONFIG = {
     "optimization": {}
 }
 
+# Parsed configs keyed by resolved path; entries are (mtime_ns, size, config)
+_CONFIG_CACHE: Dict[Path, Tuple[int, int, ProjectConfig]] = {}
+
+
+# Built once without validation; default_config() hands out copies
+_DEFAULT_PROJECT_CONFIG = ProjectConfig.model_construct(
+    prompts_dir=Path(DEFAULT_CONFIG["prompts_dir"]),
+    auto_version=DEFAULT_CONFIG["auto_version"],
+    default_model=DEFAULT_CONFIG["default_model"],
+    optimization={},
+)
+
+
+def default_config() -> ProjectConfig:
+    """Return a fresh copy of the default config."""
+    # Shallow copy; only the mutable optimization dict needs replacing
+    return _DEFAULT_PROJECT_CONFIG.model_copy(update={"optimization": {}})
+
 
 def load_config(project_root: Optional[Path] = None) -> ProjectConfig:
-    """Load project config from .promptterfly/config.yaml."""
+    """Load project config from .promptterfly/config.yaml.
+
+    Parsed configs are cached per process and reused while the file's
+    mtime and size are unchanged. A copy is returned so callers may mutate it.
+
+    Raises:
+        InvalidConfig: If config.yaml is not valid YAML or fails validation.
+    """
     if project_root is None:
         project_root = find_project_root()
     config_path = project_root / ".promptterfly" / "config.yaml"
-    if config_path.exists():
-        with open(config_path) as f:
-            data = yaml.safe_load(f) or {}
-        # Merge with defaults for missing keys
-        merged = {**DEFAULT_CONFIG, **data}
-        return ProjectConfig(**merged)
+    try:
+        st = os.stat(config_path)
+    except FileNotFoundError:
+        st = None
+    if st is not None:
+        key = config_path.resolve()
+        cached = _CONFIG_CACHE.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2].model_copy(deep=True)
+        # Binary mode lets the loader detect the encoding itself
+        with open(config_path, "rb") as f:
+            try:
+                data = yaml.load(f, Loader=_SafeLoader) or {}
+            except yaml.YAMLError as e:
+                raise InvalidConfig(f"YAML parse error in {config_path}: {e}") from e
+        # Missing keys fall back to the model's field defaults (same as DEFAULT_CONFIG)
+        try:
+            cfg = ProjectConfig.model_validate(data)
+        except ValidationError as e:
+            raise InvalidConfig(f"Invalid config in {config_path}: {e}") from e
+        _CONFIG_CACHE[key] = (st.st_mtime_ns, st.st_size, cfg)
+        return cfg.model_copy(deep=True)
     else:
         # Create default config
-        cfg = ProjectConfig(**DEFAULT_CONFIG)
+        cfg = default_config()
         ensure_dir(config_path.parent)
         save_config(project_root, cfg)
         return cfg
 
 
+def dump_config(config: ProjectConfig) -> str:
+    """Serialize config to the YAML text stored in config.yaml."""
+    # JSON mode already renders prompts_dir (a Path) as a string
+    data = config.model_dump(mode="json")
+    return yaml.dump(data, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
+
+
 def save_config(project_root: Path, config: ProjectConfig) -> None:
     """Save config to .promptterfly/config.yaml."""
     config_path = project_root / ".promptterfly" / "config.yaml"
-    data = config.model_dump(mode="json")
-    # Convert Path to string for YAML
-    if isinstance(data.get("prompts_dir"), Path):
-        data["prompts_dir"] = str(data["prompts_dir"])
-    yaml_str = yaml.dump(data, sort_keys=False)
-    atomic_write(config_path, yaml_str)
+    atomic_write(config_path, dump_config(config))
+    _CONFIG_CACHE.pop(config_path.resolve(), None)
@@ -2,11 +2,14 @@
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 
 
 class ModelConfig(BaseModel):
     """Configuration for an LLM model."""
+    # Frozen to block in-place edits; the metadata dict still makes it unhashable
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Unique model identifier")
     provider: str = Field(..., description="Provider: openai, anthropic, etc.")
     model: str = Field(..., description="Model name (e.g. gpt-4, claude-3-opus)")
@@ -33,11 +36,19 @@ class Prompt(BaseModel):
 
     def render(self, **variables) -> str:
         """Render prompt with variables."""
-        return self.template.format(**variables)
+        # format_map uses the kwargs dict as-is instead of unpacking it again
+        return self.template.format_map(variables)
+
+
+# Built once; validates a whole list of prompt dicts in a single call
+PromptListAdapter = TypeAdapter(List[Prompt])
 
 
 class Version(BaseModel):
     """A specific version of a prompt."""
+    # Frozen to block in-place edits; the snapshot dict still makes it unhashable
+    model_config = ConfigDict(frozen=True)
+
     version: int
     prompt_id: int
     snapshot: Dict[str, Any]
@@ -1,11 +1,55 @@
 """Unified LLM client wrapper."""
+import asyncio
 import os
-from typing import Optional
-import litellm
+from typing import List
 
 from ..core.models import ModelConfig
 
 
+def _completion_kwargs(prompt: str, model: ModelConfig, **kwargs) -> dict:
+    """Build litellm completion arguments for a single prompt.
+
+    Raises:
+        ValueError: If API key is required but not found.
+    """
+    # Handle API key from environment variable if specified
+    api_key = None
+    if model.api_key_env:
+        api_key = os.getenv(model.api_key_env)
+        if api_key is None:
+            raise ValueError(
+                f"API key not found in environment variable '{model.api_key_env}'. "
+                f"Set it before calling the model."
+            )
+
+    # Prepare completion parameters
+    completion_kwargs = {
+        "model": model.model,
+        "messages": [{"role": "user", "content": prompt}],
+        "temperature": model.temperature,
+        "max_tokens": model.max_tokens,
+    }
+
+    # Add API key if present
+    if api_key:
+        completion_kwargs["api_key"] = api_key
+
+    # Merge any additional kwargs
+    completion_kwargs.update(kwargs)
+    return completion_kwargs
+
+
+def _response_text(response) -> str:
+    """Extract the text from a litellm completion response."""
+    # LiteLLM returns an object with choices[0].message.content
+    if hasattr(response, 'choices') and response.choices:
+        return response.choices[0].message.content
+    elif isinstance(response, dict) and 'choices' in response:
+        return response['choices'][0]['message']['content']
+    else:
+        raise ValueError(f"Unexpected response format from LiteLLM: {response}")
+
+
 class LLMClient:
     """Unified client for making LLM API calls via LiteLLM."""
 
@@ -26,44 +70,51 @@ class LLMClient:
             ValueError: If API key is required but not found.
             Exception: For API errors from litellm.
         """
-        # Handle API key from environment variable if specified
-        api_key = None
-        if model.api_key_env:
-            api_key = os.getenv(model.api_key_env)
-            if api_key is None:
-                raise ValueError(
-                    f"API key not found in environment variable '{model.api_key_env}'. "
-                    f"Set it before calling the model."
-                )
-
-        # Prepare messages format
-        messages = [{"role": "user", "content": prompt}]
-
-        # Prepare completion parameters
-        completion_kwargs = {
-            "model": model.model,
-            "messages": messages,
-            "temperature": model.temperature,
-            "max_tokens": model.max_tokens,
-        }
-
-        # Add API key if present
-        if api_key:
-            completion_kwargs["api_key"] = api_key
-
-        # Merge any additional kwargs
-        completion_kwargs.update(kwargs)
+        completion_kwargs = _completion_kwargs(prompt, model, **kwargs)
+
+        # Imported here: litellm is slow to import and only needed for the call
+        import litellm
 
         try:
             response = litellm.completion(**completion_kwargs)
-            # Extract text from response
-            # LiteLLM returns an object with choices[0].message.content
-            if hasattr(response, 'choices') and response.choices:
-                return response.choices[0].message.content
-            elif isinstance(response, dict) and 'choices' in response:
-                return response['choices'][0]['message']['content']
-            else:
-                raise ValueError(f"Unexpected response format from LiteLLM: {response}")
+            return _response_text(response)
         except Exception as e:
             # Re-raise with more context
             raise Exception(f"LLM call failed for model '{model.name}': {e}") from e
+
+    @staticmethod
+    async def acall(prompt: str, model: ModelConfig, **kwargs) -> str:
+        """Async version of call(), using litellm.acompletion."""
+        completion_kwargs = _completion_kwargs(prompt, model, **kwargs)
+
+        import litellm
+
+        try:
+            response = await litellm.acompletion(**completion_kwargs)
+            return _response_text(response)
+        except Exception as e:
+            raise Exception(f"LLM call failed for model '{model.name}': {e}") from e
+
+    @staticmethod
+    def call_many(prompts: List[str], model: ModelConfig, concurrency: int = 8, **kwargs) -> List[str]:
+        """Call the LLM with several prompts concurrently.
+
+        At most `concurrency` requests are in flight at once. Responses are
+        returned in prompt order; the first failure is raised.
+
+        Raises:
+            ValueError: If API key is required but not found.
+            Exception: For API errors from litellm.
+        """
+        return asyncio.run(_acall_many(prompts, model, concurrency, **kwargs))
+
+
+async def _acall_many(prompts: List[str], model: ModelConfig, concurrency: int, **kwargs) -> List[str]:
+    """Run LLMClient.acall over prompts, at most `concurrency` at a time, in order."""
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def run(prompt: str) -> str:
+        async with semaphore:
+            return await LLMClient.acall(prompt, model, **kwargs)
+
+    return await asyncio.gather(*(run(p) for p in prompts))
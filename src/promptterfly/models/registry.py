@@ -1,16 +1,34 @@
 """Model registry management."""
+import functools
 import os
 from pathlib import Path
-from typing import List, Optional
-import yaml
+from typing import Dict, List, Optional, Tuple
 from pydantic import ValidationError
 
 from ..core.models import ModelConfig
-from ..utils.io import find_project_root, ensure_dir, atomic_write, load_yaml, save_yaml
+from ..utils.io import find_project_root, ensure_dir, load_yaml, save_yaml
 
 
 MODELS_FILE = ".promptterfly/models.yaml"
 
+# LiteLLM route prefix per provider; providers not listed use the bare model name
+_PROVIDER_PREFIX = {
+    "openai": "openai/",
+    "anthropic": "anthropic/",
+    "google": "gemini/",
+    "mistral": "mistral/",
+    "cohere": "cohere/",
+}
+
+# Parsed registries keyed by resolved path; entries are (mtime_ns, size, models)
+_MODELS_CACHE: Dict[Path, Tuple[int, int, List[ModelConfig]]] = {}
+
+
+@functools.lru_cache(maxsize=128)
+def litellm_model_str(provider: str, model: str) -> str:
+    """Return the LiteLLM model string (e.g. "openai/gpt-4") for a provider and model."""
+    return _PROVIDER_PREFIX.get(provider, "") + model
+
 
 def _get_models_path(project_root: Path) -> Path:
     """Get path to models.yaml file."""
@@ -20,6 +38,10 @@ def _get_models_path(project_root: Path) -> Path:
 def load_models(project_root: Optional[Path] = None) -> List[ModelConfig]:
     """Load all model configurations from .promptterfly/models.yaml.
 
+    Parsed registries are cached per process and reused while the file's
+    mtime and size are unchanged. ModelConfig is frozen, so only the list
+    itself is copied.
+
     Args:
         project_root: Project root directory. If None, auto-discovered.
 
@@ -35,12 +57,19 @@ def load_models(project_root: Optional[Path] = None) -> List[ModelConfig]:
 
     models_path = _get_models_path(project_root)
 
-    if not models_path.exists():
+    try:
+        st = os.stat(models_path)
+    except FileNotFoundError:
         # Create empty models file
         ensure_dir(models_path.parent)
         save_models([], project_root)
         return []
 
+    key = models_path.resolve()
+    cached = _MODELS_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return list(cached[2])
+
     data = load_yaml(models_path)
 
     if not data:
@@ -64,7 +93,8 @@ def load_models(project_root: Optional[Path] = None) -> List[ModelConfig]:
                 ModelConfig
             ) from e
 
-    return models
+    _MODELS_CACHE[key] = (st.st_mtime_ns, st.st_size, models)
+    return list(models)
 
 
 def save_models(models: List[ModelConfig], project_root: Path) -> None:
@@ -80,6 +110,7 @@ def save_models(models: List[ModelConfig], project_root: Path) -> None:
     # Convert to dict list for YAML serialization
     data = [model.model_dump(mode="json") for model in models]
     save_yaml(models_path, data)
+    _MODELS_CACHE.pop(models_path.resolve(), None)
 
 
 def add_model(config: ModelConfig, project_root: Optional[Path] = None) -> None:
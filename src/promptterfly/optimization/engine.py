@@ -1,12 +1,14 @@
 """DSPy optimization engine."""
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, Dict, Any, Iterator
+import hashlib
 import json
 from ..core.models import Prompt, ModelConfig
 from ..storage.prompt_store import PromptStore
 from ..core.config import load_config
-from ..models.registry import get_model_by_name, load_models
+from ..models.registry import get_model_by_name
+from ..utils.io import atomic_write_json, read_json
 from .strategies import few_shot
 
 
@@ -16,7 +18,49 @@ STRATEGIES = {
 }
 
 
-def optimize(prompt_id: int, strategy: str = 'few_shot', dataset_path: Optional[str] = None) -> Prompt:
+# Optimized templates, stored as .promptterfly/opt_cache/<key>.json
+CACHE_DIR = "opt_cache"
+
+
+def _cache_key(strategy: str, template: str, model_cfg: ModelConfig, dataset_digest: bytes) -> str:
+    """Hash everything that determines an optimization result."""
+    h = hashlib.sha256()
+    for part in (strategy.encode(), template.encode(), model_cfg.model_dump_json().encode(), dataset_digest):
+        # Length-prefix each part so boundaries can't be shifted between parts
+        h.update(len(part).to_bytes(8, "big"))
+        h.update(part)
+    return h.hexdigest()
+
+
+def _file_digest(path: Path) -> bytes:
+    """sha256 of a file, read one line at a time."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for line in f:
+            h.update(line)
+    return h.digest()
+
+
+def _iter_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield the records of a JSONL file one line at a time, skipping blank and invalid lines."""
+    with open(path, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+
+def optimize(
+    prompt_id: Optional[int] = None,
+    strategy: str = 'few_shot',
+    dataset_path: Optional[str] = None,
+    prompt: Optional[Prompt] = None,
+    use_cache: bool = True,
+    project_root: Optional[Path] = None,
+) -> Prompt:
     """
     Optimize a prompt using a specified strategy.
 
@@ -25,6 +69,12 @@ def optimize(prompt_id: int, strategy: str = 'few_shot', dataset_path: Optional[
         strategy: Optimization strategy name (default: 'few_shot').
         dataset_path: Path to dataset file (JSONL). If None, uses
                      .promptterfly/dataset.jsonl in project root.
+        prompt: Already-loaded prompt to optimize. When given, it is used
+                instead of loading prompt_id from disk.
+        use_cache: Reuse a previous result for the same template, dataset,
+                   model and strategy from .promptterfly/opt_cache.
+        project_root: Project root, if the caller already knows it.
+                      Otherwise it is discovered from the working directory.
 
     Returns:
         New Prompt instance with optimized template and updated updated_at.
@@ -34,18 +84,19 @@ def optimize(prompt_id: int, strategy: str = 'few_shot', dataset_path: Optional[
         ValueError: If strategy not found or model not configured.
     """
     # Find project root
-    from ..utils.io import find_project_root
-    project_root = find_project_root()
+    if project_root is None:
+        from ..utils.io import find_project_root
+        project_root = find_project_root()
     promptterfly_dir = project_root / ".promptterfly"
 
-    # Initialize PromptStore
-    store = PromptStore(project_root)
-
-    # Load the original prompt
-    try:
-        original_prompt = store.load_prompt(prompt_id)
-    except FileNotFoundError as e:
-        raise FileNotFoundError(f"Prompt '{prompt_id}' not found") from e
+    # Load the original prompt unless the caller already has it
+    if prompt is not None:
+        original_prompt = prompt
+    else:
+        try:
+            original_prompt = PromptStore(project_root).load_prompt(prompt_id)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Prompt '{prompt_id}' not found") from e
 
     # Determine dataset path
     if dataset_path is None:
@@ -55,30 +106,17 @@ def optimize(prompt_id: int, strategy: str = 'few_shot', dataset_path: Optional[
     if not dataset_file.exists():
         raise FileNotFoundError(f"Dataset file not found: {dataset_file}")
 
-    # Load dataset from JSONL
-    dataset: List[Dict[str, Any]] = []
-    with open(dataset_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    item = json.loads(line)
-                    dataset.append(item)
-                except json.JSONDecodeError:
-                    # Skip invalid lines
-                    continue
-
-    if not dataset:
-        raise ValueError("Dataset is empty or invalid")
+    # Reject empty datasets by parsing up to the first valid record only
+    records = _iter_jsonl(dataset_file)
+    try:
+        if next(records, None) is None:
+            raise ValueError("Dataset is empty or invalid")
+    finally:
+        records.close()
 
     # Determine model to use: per-prompt override or default
     config = load_config(project_root)
-    # Temporarily load prompt to check override
-    try:
-        _temp_p = store.load_prompt(prompt_id)
-        model_override = getattr(_temp_p, 'model_name', None)
-    except Exception:
-        model_override = None
+    model_override = original_prompt.model_name
     if model_override:
         model_cfg = get_model_by_name(model_override, project_root)
         if not model_cfg:
@@ -94,8 +132,24 @@ def optimize(prompt_id: int, strategy: str = 'few_shot', dataset_path: Optional[
         raise ValueError(f"Unknown strategy '{strategy}'. Available: {list(STRATEGIES.keys())}")
     strategy_fn = STRATEGIES[strategy]
 
-    # Run optimization
-    optimized_template = strategy_fn(original_prompt, dataset, model_cfg)
+    # Run optimization, or reuse the result of an identical earlier run
+    cache_path = promptterfly_dir / CACHE_DIR / f"{_cache_key(strategy, original_prompt.template, model_cfg, _file_digest(dataset_file))}.json"
+    optimized_template = None
+    if use_cache and cache_path.exists():
+        try:
+            optimized_template = read_json(cache_path)["template"]
+        except (OSError, ValueError, KeyError, TypeError):
+            optimized_template = None
+    if optimized_template is None:
+        # Records stream from disk; the dataset is never held in memory whole
+        dataset = _iter_jsonl(dataset_file)
+        try:
+            optimized_template = strategy_fn(original_prompt, dataset, model_cfg)
+        finally:
+            dataset.close()
+        # Strategies fall back to the original template on failure; don't pin that
+        if optimized_template != original_prompt.template:
+            atomic_write_json(cache_path, {"template": optimized_template})
 
     # Create new Prompt with updated template and updated_at
     new_prompt = Prompt(
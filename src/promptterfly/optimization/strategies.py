@@ -1,21 +1,25 @@
 """Built-in optimization strategies."""
-import dspy
-from typing import List, Dict, Any, Type
+from typing import Iterable, Dict, Any
 from ..core.models import Prompt, ModelConfig
+from ..models.registry import litellm_model_str
 
 
-def few_shot(prompt: Prompt, dataset: List[Dict[str, Any]], model_cfg: ModelConfig) -> str:
+def few_shot(prompt: Prompt, dataset: Iterable[Dict[str, Any]], model_cfg: ModelConfig) -> str:
     """
     Optimize a prompt using few-shot learning with DSPy.
 
     Args:
         prompt: The original Prompt object with template.
-        dataset: List of example dictionaries, each containing input fields and 'completion'.
+        dataset: Example dictionaries, each containing input fields and 'completion'.
+                 Consumed once, so a generator is fine.
         model_cfg: Model configuration for DSPy LM.
 
     Returns:
         An optimized prompt template string with in-context examples.
     """
+    # Imported on use so loading the engine (e.g. for `auto --help`) stays fast
+    import dspy
+
     # Configure DSPy LM from model_cfg
     # Note: We'll use a simple mapping; in production, this might use litellm
     lm_params = {
@@ -23,14 +27,8 @@ def few_shot(prompt: Prompt, dataset: List[Dict[str, Any]], model_cfg: ModelConf
         "temperature": model_cfg.temperature,
         "max_tokens": model_cfg.max_tokens,
     }
-    # Determine the DSPy model string based on provider
-    if model_cfg.provider == "openai":
-        dspy_model = f"openai/{model_cfg.model}"
-    elif model_cfg.provider == "anthropic":
-        dspy_model = f"anthropic/{model_cfg.model}"
-    else:
-        # Fallback to generic format; assume it's a LiteLLM-compatible string
-        dspy_model = model_cfg.model
+    # DSPy routes through LiteLLM, so it takes the same model string
+    dspy_model = litellm_model_str(model_cfg.provider, model_cfg.model)
 
     # Handle API keys via environment variable if specified
     if model_cfg.api_key_env:
@@ -39,9 +37,9 @@ def few_shot(prompt: Prompt, dataset: List[Dict[str, Any]], model_cfg: ModelConf
         if api_key:
             lm_params["api_key"] = api_key
 
-    # Initialize DSPy LM
+    # Initialize DSPy LM; applied per call via dspy.context so concurrent
+    # optimizations in worker threads don't share global settings
     lm = dspy.LM(dspy_model, **lm_params)
-    dspy.configure(lm=lm)
 
     # Extract input field names from prompt.template by finding {variable} patterns
     # Simple approach: use string.Formatter
@@ -102,7 +100,8 @@ def few_shot(prompt: Prompt, dataset: List[Dict[str, Any]], model_cfg: ModelConf
         max_labeled_demos=min(4, len(trainset)),
     )
     try:
-        compiled_predictor = teleprompter.compile(predictor, trainset=trainset)
+        with dspy.context(lm=lm):
+            compiled_predictor = teleprompter.compile(predictor, trainset=trainset)
     except Exception:
         # On failure, fallback to original
         return prompt.template
@@ -5,12 +5,9 @@ import click
 from pathlib import Path
 from typing import List
 from rich.console import Console
-from rich.panel import Panel
 from rich.prompt import Prompt
-import random
 
 from promptterfly.cli import app
-from promptterfly.core.config import load_config
 from promptterfly.utils.io import find_project_root
 from promptterfly.utils.quotes import get_random_quote
 
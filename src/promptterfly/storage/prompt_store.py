@@ -1,14 +1,35 @@
 """Prompt storage and CRUD operations with auto-versioning."""
-import json
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
-from pydantic import BaseModel
+from typing import Dict, List, Optional, Tuple
+from pydantic import ValidationError
 
-from ..core.models import Prompt
+from ..core.models import Prompt, PromptListAdapter
 from ..utils.io import atomic_write_json, read_json
 
+# Validated prompts keyed by file path; entries are (mtime_ns, size, prompt)
+_PROMPT_CACHE: Dict[Path, Tuple[int, int, Prompt]] = {}
+
+
+# Below this many uncached files, thread start-up costs more than it saves
+_PARALLEL_READ_MIN = 16
+
+
+def _read_json_or_none(path: Path):
+    """Read a JSON file, returning None if it can't be read or parsed."""
+    try:
+        return read_json(path)
+    except Exception:
+        return None
+
+
+def _copy_prompt(prompt: Prompt) -> Prompt:
+    """Copy a cached prompt so callers can mutate it (including tags/metadata)."""
+    return prompt.model_copy(update={"tags": list(prompt.tags), "metadata": dict(prompt.metadata)})
+
 
 class PromptStore:
     """Manages prompt persistence in the local filesystem."""
@@ -66,6 +87,18 @@ class PromptStore:
         """
         return self.prompts_dir / f"{prompt_id}.json"
 
+    def prompt_exists(self, prompt_id: int) -> bool:
+        """
+        Check whether a prompt file exists without loading it.
+
+        Args:
+            prompt_id: Prompt identifier (integer)
+
+        Returns:
+            True if the prompt's JSON file exists
+        """
+        return self.get_prompt_path(prompt_id).is_file()
+
     def get_versions_dir(self, prompt_id: int) -> Path:
         """
         Get directory containing version snapshots for a prompt.
@@ -124,6 +157,9 @@ class PromptStore:
         data = self._prompt_to_dict(prompt)
         target_path = self.get_prompt_path(prompt.id)
         atomic_write_json(target_path, data)
+        # A same-size rewrite within the filesystem's mtime granularity
+        # would otherwise still match the cached stat
+        _PROMPT_CACHE.pop(target_path, None)
 
     def load_prompt(self, prompt_id: int) -> Prompt:
         """
@@ -148,27 +184,72 @@ class PromptStore:
         """
         List all prompts in the prompts directory.
 
+        Parsed prompts are cached per process and reused while each file's
+        mtime and size are unchanged, so repeat listings only stat files.
+
         Returns:
             List of Prompt instances sorted by updated_at (newest first)
         """
-        prompts = []
         if not self.prompts_dir.exists():
-            return prompts
+            return []
 
-        for json_file in self.prompts_dir.glob("*.json"):
-            try:
-                data = read_json(json_file)
-                prompt = self._dict_to_prompt(data)
+        prompts = []
+        stale = []
+        with os.scandir(self.prompts_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                st = entry.stat()
+                path = Path(entry.path)
+                cached = _PROMPT_CACHE.get(path)
+                if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    prompts.append(cached[2])
+                else:
+                    stale.append((path, st))
+
+        if len(stale) >= _PARALLEL_READ_MIN:
+            # Cold listings of many files overlap their reads; file I/O
+            # releases the GIL, and validation below stays one batched call
+            with ThreadPoolExecutor(max_workers=min(16, len(stale))) as pool:
+                loaded = list(pool.map(_read_json_or_none, [path for path, _ in stale]))
+        else:
+            loaded = [_read_json_or_none(path) for path, _ in stale]
+
+        paths = []
+        blobs = []
+        for (path, st), data in zip(stale, loaded):
+            # Skip unreadable files
+            if data is not None:
+                blobs.append(data)
+                paths.append((path, st))
+
+        try:
+            parsed = PromptListAdapter.validate_python(blobs)
+        except ValidationError:
+            # Fall back to per-file validation so invalid prompts are skipped
+            parsed = []
+            for data in blobs:
+                try:
+                    parsed.append(self._dict_to_prompt(data))
+                except ValidationError:
+                    parsed.append(None)
+
+        for (path, st), prompt in zip(paths, parsed):
+            if prompt is not None:
+                _PROMPT_CACHE[path] = (st.st_mtime_ns, st.st_size, prompt)
                 prompts.append(prompt)
-            except Exception:
-                # Skip invalid files
-                continue
 
         # Sort by updated_at descending
         prompts.sort(key=lambda p: p.updated_at, reverse=True)
-        return prompts
-
-    def create_snapshot(self, prompt_id: int, message: Optional[str] = None) -> None:
+        return [_copy_prompt(p) for p in prompts]
+
+    def create_snapshot(
+        self,
+        prompt_id: int,
+        message: Optional[str] = None,
+        prompt: Optional[Prompt] = None,
+        skip_unchanged: bool = False,
+    ) -> int:
         """
         Create a version snapshot of the current prompt.
 
@@ -178,6 +259,13 @@ class PromptStore:
         Args:
             prompt_id: Prompt identifier (integer)
             message: Optional commit message for this version
+            prompt: The prompt as currently saved, if the caller already
+                loaded it; otherwise it is read from disk
+            skip_unchanged: If the latest version already holds exactly this
+                prompt, write nothing and return that version's number
+
+        Returns:
+            The new (or reused) version number
 
         Raises:
             FileNotFoundError: If the prompt doesn't exist
@@ -187,7 +275,7 @@ class PromptStore:
         versions_dir.mkdir(parents=True, exist_ok=True)
 
         # Load the current prompt
-        current_prompt = self.load_prompt(prompt_id)
+        current_prompt = prompt if prompt is not None else self.load_prompt(prompt_id)
 
         # Determine next version number
         existing_versions = list(versions_dir.glob("*.json"))
@@ -204,11 +292,20 @@ class PromptStore:
         else:
             next_version = 1
 
+        prompt_data = current_prompt.model_dump(mode='json')
+        if skip_unchanged and next_version > 1:
+            latest_path = versions_dir / f"{next_version - 1:03d}.json"
+            try:
+                if read_json(latest_path).get("snapshot") == prompt_data:
+                    return next_version - 1
+            except Exception:
+                pass  # unreadable latest version: snapshot as usual
+
         # Create version snapshot
         snapshot = {
             "version": next_version,
             "prompt_id": prompt_id,
-            "snapshot": current_prompt.model_dump(mode='json'),
+            "snapshot": prompt_data,
             "message": message,
             "created_at": datetime.now().isoformat()
         }
@@ -231,6 +328,7 @@ class PromptStore:
         # Write snapshot
         version_path = versions_dir / f"{next_version:03d}.json"
         atomic_write_json(version_path, snapshot)
+        return next_version
 
     def delete_prompt(self, prompt_id: int) -> None:
         """
@@ -243,6 +341,7 @@ class PromptStore:
         path = self.get_prompt_path(prompt_id)
         if path.exists():
             path.unlink()
+        _PROMPT_CACHE.pop(path, None)
 
         # Delete versions directory
         versions_dir = self.get_versions_dir(prompt_id)
@@ -1,10 +1,9 @@
 """Version management operations."""
-from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
 from ..core.models import Prompt, Version
-from ..utils.io import read_json, atomic_write_json
+from ..utils.io import read_json
 
 
 class VersionStore:
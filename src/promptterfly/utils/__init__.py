@@ -7,12 +7,16 @@ from .io import (
     read_json,
     load_yaml,
     save_yaml,
+    ensure_line,
+    parse_dotenv_keys,
+    set_dotenv_var,
 )
 from .tui import (
     print_table,
     print_success,
     print_error,
     print_warning,
+    format_datetime,
     highlight_code,
 )
 from .loader import spiky_loading, show_spinner, _SpikyLoading
@@ -25,10 +29,14 @@ __all__ = [
     "read_json",
     "load_yaml",
     "save_yaml",
+    "ensure_line",
+    "parse_dotenv_keys",
+    "set_dotenv_var",
     "print_table",
     "print_success",
     "print_error",
     "print_warning",
+    "format_datetime",
     "highlight_code",
     "spiky_loading",
     "show_spinner",
@@ -1,18 +1,33 @@
 """I/O utilities for Promptterfly."""
 import os
+import functools
 import json
 import yaml
 from pathlib import Path
 from typing import Any, Optional, Union
 import tempfile
-import shutil
+
+# Prefer the LibYAML C bindings; fall back to the pure-Python implementation
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader, SafeDumper
 
 
 def find_project_root(start: Optional[Path] = None) -> Path:
-    """Find project root by searching up for .promptterfly directory."""
+    """Find project root by searching up for .promptterfly directory.
+
+    Results are memoized per start directory for the life of the process;
+    call find_project_root.cache_clear() after creating a new project.
+    """
     if start is None:
         start = Path.cwd()
-    current = start.resolve()
+    return _find_project_root_cached(start.resolve())
+
+
+@functools.lru_cache(maxsize=8)
+def _find_project_root_cached(current: Path) -> Path:
+    """Walk up from a resolved directory to the nearest .promptterfly parent."""
     while current != current.parent:
         if (current / ".promptterfly").is_dir():
             return current
@@ -20,6 +35,9 @@ def find_project_root(start: Optional[Path] = None) -> Path:
     raise FileNotFoundError("No .promptterfly directory found in parent directories")
 
 
+find_project_root.cache_clear = _find_project_root_cached.cache_clear
+
+
 def ensure_dir(path: Union[str, Path]) -> Path:
     """Create directory if it doesn't exist."""
     p = Path(path)
@@ -31,10 +49,16 @@ def atomic_write(path: Union[str, Path], data: str) -> None:
     """Atomically write text file using temp file + rename."""
     p = Path(path)
     ensure_dir(p.parent)
-    with tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', dir=p.parent, delete=False) as f:
-        f.write(data)
-        temp_path = f.name
-    os.replace(temp_path, p)
+    fd, temp_path = tempfile.mkstemp(dir=p.parent, prefix=f".{p.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(temp_path, p)
+    except BaseException:
+        # Never leave a partial temp file behind (e.g. on Ctrl+C)
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
 
 
 def atomic_write_json(path: Union[str, Path], data: Any, indent: int = 2) -> None:
@@ -51,11 +75,76 @@ def read_json(path: Union[str, Path]) -> Any:
 
 def load_yaml(path: Union[str, Path]) -> Any:
     """Load YAML file."""
-    with open(path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f) or {}
+    # Binary mode lets the loader detect the encoding itself
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=SafeLoader) or {}
 
 
 def save_yaml(path: Union[str, Path], data: Any) -> None:
     """Save data to YAML file."""
-    yaml_str = yaml.dump(data, sort_keys=False, allow_unicode=True)
+    yaml_str = yaml.dump(data, Dumper=SafeDumper, sort_keys=False, allow_unicode=True)
     atomic_write(path, yaml_str)
+
+
+def _read_text_or_empty(path: Path) -> str:
+    """Read a text file, treating a missing file as empty."""
+    try:
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return ""
+
+
+def ensure_line(path: Union[str, Path], line: str) -> bool:
+    """Append line to a text file (e.g. .gitignore) unless already present.
+
+    Reads the file once and writes it once. Returns True if the file changed.
+    """
+    p = Path(path)
+    text = _read_text_or_empty(p)
+    if line in {existing.strip() for existing in text.splitlines()}:
+        return False
+    if text and not text.endswith("\n"):
+        text += "\n"
+    p.write_text(f"{text}{line}\n", encoding="utf-8")
+    return True
+
+
+def parse_dotenv_keys(text: str) -> set:
+    """Return the set of variable names defined in .env-style text.
+
+    Comment lines are ignored and an optional ``export`` prefix is stripped.
+    """
+    keys = set()
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        key, sep, _ = line.partition("=")
+        if sep:
+            key = key.strip()
+            if key.startswith("export "):
+                key = key[len("export "):].strip()
+            keys.add(key)
+    return keys
+
+
+def set_dotenv_var(path: Union[str, Path], key: str, value: str) -> bool:
+    """Add KEY=value to a .env file unless KEY is already defined.
+
+    Reads the file once and appends the new line with a single write. A new
+    file is created owner-only (0600) since it holds secrets; an existing
+    file keeps its permissions. Returns True if the key was written.
+    """
+    p = Path(path)
+    text = _read_text_or_empty(p)
+    if key in parse_dotenv_keys(text):
+        return False
+    line = f"{key}={value}\n"
+    if text and not text.endswith("\n"):
+        line = "\n" + line
+    fd = os.open(p, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+    try:
+        os.write(fd, line.encode("utf-8"))
+    finally:
+        os.close(fd)
+    return True
@@ -0,0 +1,71 @@
+"""Provider -> model catalog derived from litellm, cached on disk.
+
+Importing litellm takes hundreds of milliseconds, so the interactive model
+picker reads a JSON snapshot instead. A snapshot younger than CATALOG_TTL is
+served as-is; an older one is still served while a background thread
+rebuilds it. litellm is only imported in the foreground when no snapshot
+exists yet.
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+from .io import atomic_write_json
+
+CATALOG_TTL = 24 * 60 * 60  # seconds
+
+
+def catalog_path() -> Path:
+    """Location of the cached catalog (honours XDG_CACHE_HOME)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "promptterfly" / "models.json"
+
+
+def build_catalog() -> Dict[str, List[str]]:
+    """Group litellm's model_list by provider prefix.
+
+    Returns an empty catalog if litellm is not installed.
+    """
+    try:
+        from litellm import model_list
+    except ImportError:
+        return {}
+    if isinstance(model_list, dict):
+        entries = [(p, m) for p, models in model_list.items() for m in (models or [])]
+    else:
+        # Only prefixed names can be attributed to a provider
+        entries = [tuple(m.split("/", 1)) for m in model_list if isinstance(m, str) and "/" in m]
+    grouped: Dict[str, set] = {}
+    for provider, model in entries:
+        if isinstance(model, str):
+            # Strip any provider prefix that might be included
+            grouped.setdefault(provider, set()).add(model.split("/", 1)[-1])
+    return {p: sorted(models) for p, models in grouped.items()}
+
+
+def _refresh(path: Path) -> Dict[str, List[str]]:
+    """Rebuild the catalog and write it to disk, returning it."""
+    catalog = build_catalog()
+    if catalog:
+        try:
+            atomic_write_json(path, catalog, indent=None)
+        except OSError:
+            pass  # an unwritable cache dir just means no caching
+    return catalog
+
+
+def load_catalog(path: Optional[Path] = None) -> Dict[str, List[str]]:
+    """Return the provider -> models catalog, preferring the on-disk copy."""
+    if path is None:
+        path = catalog_path()
+    try:
+        age = time.time() - path.stat().st_mtime
+        with open(path, "rb") as f:
+            catalog = json.load(f)
+    except (OSError, ValueError):
+        return _refresh(path)
+    if age > CATALOG_TTL:
+        threading.Thread(target=_refresh, args=(path,), daemon=True).start()
+    return catalog
@@ -1,4 +1,6 @@
 """Terminal UI helpers using Rich."""
+import sys
+from datetime import datetime
 from rich.console import Console
 from rich.table import Table
 from rich.syntax import Syntax
@@ -9,7 +11,13 @@ console = Console()
 
 
 def print_table(columns: List[str], rows: List[List[Any]], title: str = None) -> None:
-    """Print a rich table."""
+    """Print a rich table, or tab-separated lines when stdout is not a terminal."""
+    if not console.is_terminal:
+        # Pipes and scripts get parseable output without Rich's layout pass
+        lines = ["\t".join(columns)]
+        lines.extend("\t".join(str(cell) for cell in row) for row in rows)
+        sys.stdout.write("\n".join(lines) + "\n")
+        return
     table = Table(title=title, show_header=True, header_style="bold magenta")
     for col in columns:
         table.add_column(col)
@@ -33,6 +41,15 @@ def print_warning(msg: str) -> None:
     console.print(f"[bold yellow]⚠[/] {msg}")
 
 
+def format_datetime(dt: datetime, seconds: bool = False) -> str:
+    """Format a timestamp for display as 'YYYY-MM-DD HH:MM[:SS]'."""
+    # isoformat is several times faster than strftime and locale-independent;
+    # the UTC offset of aware datetimes is dropped, as strftime did
+    if dt.tzinfo is not None:
+        dt = dt.replace(tzinfo=None)
+    return dt.isoformat(" ", "seconds" if seconds else "minutes")
+
+
 def highlight_code(code: str, lexer: str = None, theme: str = "monokai") -> Syntax:
     """Return a Rich Syntax object for code highlighting."""
     return Syntax(code, lexer or "text", theme=theme, line_numbers=True, word_wrap=True)
@@ -1,2 +1,93 @@
-import pytest
-from promptterfly.commands.auto import auto_optimize_all
+from datetime import datetime
+from typer.testing import CliRunner
+from promptterfly.commands.auto import app
+from promptterfly.core.models import ModelConfig, Prompt
+from promptterfly.models.registry import save_models
+
+runner = CliRunner()
+
+
+def test_optimize_all_dry_run_resolves_models(populated_promptstore, monkeypatch):
+    """Test that dry-run resolves per-prompt and default models from the registry."""
+    project_root = populated_promptstore.project_root
+    save_models(
+        [ModelConfig(name="gpt-3.5-turbo", provider="openai", model="gpt-3.5-turbo")],
+        project_root,
+    )
+    now = datetime.now()
+    populated_promptstore.save_prompt(
+        Prompt(id=2, name="Other", template="Hi {x}", created_at=now, updated_at=now,
+               model_name="missing-model")
+    )
+    (project_root / ".promptterfly" / "dataset.jsonl").write_text('{"input": "a", "completion": "b"}\n')
+    monkeypatch.chdir(project_root)
+
+    result = runner.invoke(app, ["optimize-all", "--dry-run"])
+    assert result.exit_code == 0
+    assert "1: Test Prompt -> dry-run" in result.stdout
+    assert "2: Other -> skipped (model)" in result.stdout
+
+
+def test_optimize_all_runs_prompts_concurrently(populated_promptstore, monkeypatch):
+    """Test that concurrent optimization saves results and keeps summary order."""
+    import promptterfly.commands.auto as auto_module
+
+    project_root = populated_promptstore.project_root
+    save_models(
+        [ModelConfig(name="gpt-3.5-turbo", provider="openai", model="gpt-3.5-turbo")],
+        project_root,
+    )
+    now = datetime.now()
+    populated_promptstore.save_prompt(
+        Prompt(id=2, name="Other", template="Hi {x}", created_at=now, updated_at=now)
+    )
+    (project_root / ".promptterfly" / "dataset.jsonl").write_text('{"input": "a", "completion": "b"}\n')
+    monkeypatch.chdir(project_root)
+
+    def fake_optimize(prompt, dataset_path, use_cache=True, project_root=None):
+        return prompt.model_copy(update={"template": prompt.template + " [opt]"})
+
+    monkeypatch.setattr(auto_module, "engine_optimize", fake_optimize)
+
+    result = runner.invoke(app, ["optimize-all", "--concurrency", "2"])
+    assert result.exit_code == 0
+    summary = result.stdout.split("Optimization Summary:")[1]
+    ids = [line.strip().split(":")[0] for line in summary.splitlines() if "->" in line]
+    assert ids == [str(p.id) for p in populated_promptstore.list_prompts()]
+    assert "optimized (1 iter)" in summary
+    for pid in (1, 2):
+        assert populated_promptstore.load_prompt(pid).template.endswith(" [opt]")
+
+
+def test_run_in_processes_keeps_job_order():
+    """Test that process-pool jobs return results in submission order."""
+    import operator
+    from promptterfly.commands.auto import _run_in_processes
+
+    jobs = [(operator.mul, i, 10) for i in range(4)]
+    assert _run_in_processes(jobs, 2) == [0, 10, 20, 30]
+
+
+def test_bootstrap_stops_on_cycle(populated_promptstore, monkeypatch):
+    """Test that bootstrap stops when the optimizer returns to an earlier template."""
+    import promptterfly.commands.auto as auto_module
+
+    project_root = populated_promptstore.project_root
+    (project_root / ".promptterfly" / "dataset.jsonl").write_text('{"input": "a", "completion": "b"}\n')
+    monkeypatch.chdir(project_root)
+    original = populated_promptstore.load_prompt(1).template
+    alternate = original + " with a much longer set of instructions"
+    calls = []
+
+    def flip_flop(prompt, **kwargs):
+        calls.append(prompt.template)
+        new = alternate if prompt.template == original else original
+        return prompt.model_copy(update={"template": new})
+
+    monkeypatch.setattr(auto_module, "engine_optimize", flip_flop)
+
+    result = runner.invoke(app, ["bootstrap", "--max-iter", "5"])
+    assert result.exit_code == 0
+    assert "Cycle detected" in result.stdout
+    assert len(calls) == 2
+    assert populated_promptstore.load_prompt(1).template == alternate
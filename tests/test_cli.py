@@ -20,6 +20,18 @@ def test_init_command(tmp_path: Path):
     assert (pt_dir / "prompts").exists()
 
 
+def test_lazy_subcommand_groups():
+    """Test that lazily registered groups keep their subcommands."""
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    for name in ("prompt", "version", "optimize", "model", "auto", "dataset"):
+        assert name in result.stdout
+    # Single-command groups must not collapse into their only command
+    result = runner.invoke(app, ["optimize", "--help"])
+    assert result.exit_code == 0
+    assert "improve" in result.stdout
+
+
 def test_config_show(tmp_path: Path):
     """Test 'config' command shows current configuration."""
     # Initialize first
@@ -40,6 +52,27 @@ def test_config_set(tmp_path: Path):
     assert "auto_version: false" in result.stdout
 
 
+def test_config_show_json(temp_project_root: Path, monkeypatch):
+    """Test 'config --format json' prints the configuration as JSON."""
+    monkeypatch.chdir(temp_project_root)
+    result = runner.invoke(app, ["config", "--format", "json"])
+    assert result.exit_code == 0
+    data = json.loads(result.stdout)
+    assert data["default_model"] == "gpt-3.5-turbo"
+    assert data["prompts_dir"] == "prompts"
+
+
+def test_config_set_rejects_invalid_value(temp_project_root: Path, monkeypatch):
+    """Test 'config-set' reports values that don't match the setting's type."""
+    config_path = temp_project_root / ".promptterfly" / "config.yaml"
+    config_path.write_text("retention_policy: 5\n")
+    monkeypatch.chdir(temp_project_root)
+    result = runner.invoke(app, ["config-set", "retention_policy", "many"])
+    assert result.exit_code == 1
+    assert "Invalid int for retention_policy: many" in result.stdout
+    assert "retention_policy: 5" in config_path.read_text()
+
+
 def test_prompt_create_and_list(tmp_path: Path):
     """Test creating a prompt and listing it."""
     runner.invoke(app, ["init"], cwd=tmp_path)
@@ -319,3 +352,172 @@ def test_optimize_errors(tmp_path: Path):
     result = runner.invoke(app, ["optimize", "improve", prompt_id, "--strategy", "unknown"], cwd=tmp_path)
     assert result.exit_code == 1
     assert "Unknown strategy" in result.stdout
+
+
+def test_model_add_saves_api_key_once(temp_project_root: Path, monkeypatch):
+    """Test 'model add' writes the API key and .gitignore entry without duplicates."""
+    monkeypatch.chdir(temp_project_root)
+    (temp_project_root / ".env").write_text("PREFIX_OPENAI_API_KEY=other\n")
+    args = ["model", "add", "gpt4", "--provider", "openai", "--model", "gpt-4"]
+    result = runner.invoke(app, args, input="y\nsk-1\n")
+    assert result.exit_code == 0, result.stdout
+    result = runner.invoke(app, args, input="y\nsk-2\n")
+    assert "already exists in .env" in result.stdout
+    assert (temp_project_root / ".env").read_text() == "PREFIX_OPENAI_API_KEY=other\nOPENAI_API_KEY=sk-1\n"
+    assert (temp_project_root / ".gitignore").read_text() == ".env\n"
+
+
+@pytest.mark.parametrize("model_str,provider", [
+    ("gpt-4", "openai"),
+    ("text-davinci-003", "openai"),
+    ("Claude-3-Opus", "anthropic"),
+    ("gemini-pro", "google"),
+    ("mistral-large", "mistral"),
+    ("command-r", "cohere"),
+    ("groq/llama3-70b", "groq"),
+    ("claude-gpt-hybrid", "openai"),  # earlier rules take priority
+    ("llama3", None),
+])
+def test_infer_provider(model_str, provider):
+    """Test provider inference from model identifiers."""
+    from promptterfly.commands.model import infer_provider
+    assert infer_provider(model_str) == provider
+
+
+def test_model_list_plain_output_when_piped(temp_project_root: Path, monkeypatch):
+    """Test 'model list' prints tab-separated rows when stdout is not a terminal."""
+    from promptterfly.core.models import ModelConfig
+    from promptterfly.models.registry import save_models
+
+    save_models(
+        [
+            ModelConfig(name="gpt-3.5-turbo", provider="openai", model="gpt-3.5-turbo"),
+            ModelConfig(name="claude", provider="anthropic", model="claude-3-opus"),
+        ],
+        temp_project_root,
+    )
+    monkeypatch.chdir(temp_project_root)
+    result = runner.invoke(app, ["model", "list"])
+    assert result.exit_code == 0
+    lines = result.stdout.splitlines()
+    assert lines[0].split("\t")[:3] == ["Name", "Provider", "Model"]
+    assert lines[1].split("\t")[0] == "gpt-3.5-turbo"
+    assert lines[1].endswith("\t(default)")
+    assert lines[2].split("\t")[0] == "claude"
+
+
+def test_get_models_cached_per_provider(tmp_path: Path, monkeypatch):
+    """Test that the model catalog is consulted once per provider."""
+    import litellm
+    from promptterfly.commands.model import _get_models
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(litellm, "model_list", ["openai/gpt-4o", "openai/gpt-4", "openai/gpt-4", "anthropic/claude-3"])
+    _get_models.cache_clear()
+    try:
+        assert _get_models("openai") == ("gpt-4", "gpt-4o")
+        (tmp_path / "promptterfly" / "models.json").unlink()
+        monkeypatch.setattr(litellm, "model_list", [])
+        assert _get_models("openai") == ("gpt-4", "gpt-4o")
+    finally:
+        _get_models.cache_clear()
+
+
+@pytest.mark.parametrize("lines,limit,expected", [(40, 10, 10), (12, 10, 6), (4, 5, 3)])
+def test_menu_size_fits_terminal(lines, limit, expected, monkeypatch):
+    """Test that interactive menus shrink on short terminals."""
+    from promptterfly.commands import model as model_cmd
+
+    monkeypatch.setattr(model_cmd.shutil, "get_terminal_size", lambda fallback: os.terminal_size((80, lines)))
+    assert model_cmd._menu_size(limit) == expected
+
+
+def test_prompt_find(temp_project_root: Path, monkeypatch):
+    """Test 'prompt find' auto-selects an exact name and ranks partial matches."""
+    from datetime import datetime
+    from promptterfly.core.models import Prompt
+
+    store = PromptStore(temp_project_root)
+    now = datetime(2024, 1, 1)
+    for i, (name, template) in enumerate([
+        ("Email writer", "Write a polite email about {topic}"),
+        ("Code reviewer", "Review this code: {code}"),
+        ("Email summarizer", "Summarize the email thread: {thread}"),
+    ], start=1):
+        store.save_prompt(Prompt(id=i, name=name, template=template, created_at=now, updated_at=now))
+    monkeypatch.chdir(temp_project_root)
+
+    result = runner.invoke(app, ["prompt", "find", "code reviewer"])
+    assert result.exit_code == 0
+    assert "Best match: Prompt 2 - Code reviewer" in result.stdout
+
+    result = runner.invoke(app, ["prompt", "find", "email"], input="\n")
+    assert result.exit_code == 0
+    assert "Top matches" in result.stdout
+    assert "Email writer" in result.stdout and "Email summarizer" in result.stdout
+
+
+def test_prompt_create_and_update_piped_template(temp_project_root: Path, monkeypatch):
+    """Test that piped stdin supplies a multi-line template in one read."""
+    monkeypatch.chdir(temp_project_root)
+    result = runner.invoke(app, ["prompt", "create"], input="Piped\n\n\nLine one {x}\nLine two\n")
+    assert result.exit_code == 0, result.stdout
+    store = PromptStore(temp_project_root)
+    (created,) = store.list_prompts()
+    assert created.template == "Line one {x}\nLine two"
+
+    result = runner.invoke(app, ["prompt", "update", str(created.id)], input="\n\n\nNew {x}\n")
+    assert result.exit_code == 0, result.stdout
+    assert store.load_prompt(created.id).template == "New {x}"
+
+
+def test_prompt_render_vars_file(temp_project_root: Path, monkeypatch):
+    """Test rendering with a UTF-8 variables file."""
+    from datetime import datetime
+    from promptterfly.core.models import Prompt
+
+    now = datetime(2024, 1, 1)
+    PromptStore(temp_project_root).save_prompt(
+        Prompt(id=1, name="Greet", template="Hello {name}!", created_at=now, updated_at=now)
+    )
+    vars_file = temp_project_root / "vars.json"
+    vars_file.write_bytes(json.dumps({"name": "Zoë"}, ensure_ascii=False).encode("utf-8"))
+    monkeypatch.chdir(temp_project_root)
+    result = runner.invoke(app, ["prompt", "render", "1", str(vars_file)])
+    assert result.exit_code == 0
+    assert result.stdout.strip() == "Hello Zoë!"
+
+
+@pytest.mark.parametrize("name,existing,expected", [
+    ("Draft", set(), "Draft"),
+    ("Draft", {"Draft"}, "Draft_2"),
+    ("Draft", {"Draft", "Draft_2", "Draft_7", "Draft_x", "Drafts_9"}, "Draft_8"),
+    ("a.b", {"a.b", "axb_5"}, "a.b_2"),
+])
+def test_unique_name(name, existing, expected):
+    """Test that duplicate prompt names get the next free numeric suffix."""
+    from promptterfly.commands.prompt import _unique_name
+    assert _unique_name(name, existing) == expected
+
+
+def test_score_prompt_saturates_on_huge_template_overlap():
+    """Test that a query sharing thousands of words with a template scores 1.0 instead of overflowing."""
+    from datetime import datetime
+    from promptterfly.commands.prompt import _score_prompt
+    from promptterfly.core.models import Prompt
+
+    words = " ".join(f"w{i}" for i in range(1100))
+    now = datetime(2024, 1, 1)
+    prompt = Prompt(id=1, name="Big", template=words, created_at=now, updated_at=now)
+    assert _score_prompt(words, prompt) == 1.0
+
+
+def test_format_datetime_matches_strftime():
+    """Test that the display formatter matches the previous strftime formats."""
+    from datetime import datetime, timezone
+    from promptterfly.utils.tui import format_datetime
+
+    dt = datetime(2024, 3, 5, 7, 8, 9, 123456)
+    assert format_datetime(dt) == dt.strftime("%Y-%m-%d %H:%M")
+    assert format_datetime(dt, seconds=True) == dt.strftime("%Y-%m-%d %H:%M:%S")
+    assert format_datetime(dt.replace(tzinfo=timezone.utc)) == "2024-03-05 07:08"
@@ -0,0 +1,63 @@
+"""Unit tests for configuration loading and saving."""
+import pytest
+from pathlib import Path
+from promptterfly.core.config import load_config, save_config, default_config
+from promptterfly.core.models import ProjectConfig
+from promptterfly.core.exceptions import InvalidConfig
+
+
+def test_default_config_matches_validated_defaults():
+    """Test that the unvalidated default config equals a validated one."""
+    cfg = default_config()
+    assert cfg == ProjectConfig()
+    assert isinstance(cfg.prompts_dir, Path)
+    # Each call gets its own mutable containers
+    cfg.optimization["metric"] = "accuracy"
+    assert default_config().optimization == {}
+
+
+class TestConfigCache:
+    """Tests for the in-process config cache."""
+
+    def test_repeat_load_returns_equal_copies(self, temp_project_root: Path):
+        """Test that cached loads return equal but independent objects."""
+        first = load_config(temp_project_root)
+        second = load_config(temp_project_root)
+        assert first == second
+        assert first is not second
+        first.optimization["max_epochs"] = 5
+        assert load_config(temp_project_root).optimization == {}
+
+    def test_save_invalidates_cache(self, temp_project_root: Path):
+        """Test that saving a config is visible to the next load."""
+        cfg = load_config(temp_project_root)
+        cfg.default_model = "claude-3-opus"
+        save_config(temp_project_root, cfg)
+        assert load_config(temp_project_root).default_model == "claude-3-opus"
+
+    def test_external_edit_invalidates_cache(self, temp_project_root: Path):
+        """Test that editing config.yaml on disk is picked up."""
+        load_config(temp_project_root)
+        config_path = temp_project_root / ".promptterfly" / "config.yaml"
+        config_path.write_text("default_model: edited-model\nauto_version: false\n")
+        cfg = load_config(temp_project_root)
+        assert cfg.default_model == "edited-model"
+        assert cfg.auto_version is False
+
+
+class TestInvalidConfig:
+    """Tests for config.yaml parse and validation errors."""
+
+    def test_yaml_syntax_error(self, temp_project_root: Path):
+        """Test that malformed YAML raises InvalidConfig."""
+        config_path = temp_project_root / ".promptterfly" / "config.yaml"
+        config_path.write_text("default_model: [unclosed\n")
+        with pytest.raises(InvalidConfig, match="YAML parse error"):
+            load_config(temp_project_root)
+
+    def test_schema_error(self, temp_project_root: Path):
+        """Test that values of the wrong type raise InvalidConfig."""
+        config_path = temp_project_root / ".promptterfly" / "config.yaml"
+        config_path.write_text("auto_version: sometimes\n")
+        with pytest.raises(InvalidConfig, match="Invalid config"):
+            load_config(temp_project_root)
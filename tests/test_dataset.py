@@ -0,0 +1,143 @@
+"""Tests for dataset generation with a mocked LLM."""
+import json
+from pathlib import Path
+from types import SimpleNamespace
+import litellm
+from typer.testing import CliRunner
+from promptterfly.commands.dataset import app
+from promptterfly.core.models import ModelConfig
+from promptterfly.models.registry import save_models
+
+runner = CliRunner()
+
+
+def _response(text: str):
+    """Build a minimal litellm-style completion response."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))])
+
+
+def test_generate_batches_and_dedupes(temp_project_root: Path, monkeypatch):
+    """Test that generation is split into batches and duplicate examples are dropped."""
+    save_models(
+        [ModelConfig(name="gpt-3.5-turbo", provider="openai", model="gpt-3.5-turbo")],
+        temp_project_root,
+    )
+    monkeypatch.chdir(temp_project_root)
+    calls = []
+
+    async def fake_acompletion(model, messages, **kwargs):
+        calls.append(messages[0]["content"])
+        i = len(calls)
+        lines = [
+            json.dumps({"input": "same", "completion": "dup"}),
+            json.dumps({"input": f"q{i}", "completion": f"a{i}"}),
+            "not json",
+        ]
+        return _response("\n".join(lines))
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+
+    result = runner.invoke(app, ["--count", "5", "--batch-size", "2"])
+    assert result.exit_code == 0, result.stdout
+    # ceil(5 / 2) requests, the last one asking for the remainder
+    assert len(calls) == 3
+    assert "generate 1 diverse" in calls[-1]
+    lines = (temp_project_root / ".promptterfly" / "dataset.jsonl").read_text().splitlines()
+    examples = [json.loads(line) for line in lines]
+    assert len(examples) == 4
+    assert sum(ex["input"] == "same" for ex in examples) == 1
+
+
+def test_generate_skips_examples_already_in_dataset(temp_project_root: Path, monkeypatch):
+    """Test that examples already present in dataset.jsonl are not appended again."""
+    save_models(
+        [ModelConfig(name="gpt-3.5-turbo", provider="openai", model="gpt-3.5-turbo")],
+        temp_project_root,
+    )
+    monkeypatch.chdir(temp_project_root)
+    dataset_file = temp_project_root / ".promptterfly" / "dataset.jsonl"
+    dataset_file.write_text(json.dumps({"input": "old", "completion": "x"}) + "\n")
+
+    async def fake_acompletion(model, messages, **kwargs):
+        lines = [json.dumps({"input": "old", "completion": "x"}), json.dumps({"input": "new", "completion": "y"})]
+        return _response("\n".join(lines))
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+
+    result = runner.invoke(app, ["--count", "2"])
+    assert result.exit_code == 0, result.stdout
+    assert "total now 2" in result.stdout
+    assert [json.loads(line)["input"] for line in dataset_file.read_text().splitlines()] == ["old", "new"]
+
+    result = runner.invoke(app, ["--count", "2"])
+    assert result.exit_code == 1
+    assert "already in the dataset" in result.stdout
+
+
+def test_generate_sample_n(temp_project_root: Path, monkeypatch):
+    """Test that --sample-n requests one example per choice with n choices per call."""
+    save_models(
+        [ModelConfig(name="gpt-3.5-turbo", provider="openai", model="gpt-3.5-turbo")],
+        temp_project_root,
+    )
+    monkeypatch.chdir(temp_project_root)
+    ns = []
+
+    async def fake_acompletion(model, messages, n, **kwargs):
+        ns.append(n)
+        base = sum(ns) - n
+        contents = [json.dumps({"input": f"q{base + i}", "completion": "a"}, indent=2) for i in range(n)]
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=c)) for c in contents])
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+
+    result = runner.invoke(app, ["--count", "3", "--batch-size", "2", "--sample-n"])
+    assert result.exit_code == 0, result.stdout
+    assert sorted(ns) == [1, 2]
+    lines = (temp_project_root / ".promptterfly" / "dataset.jsonl").read_text().splitlines()
+    assert len(lines) == 3
+
+
+def test_generate_warns_on_failed_batches(temp_project_root: Path, monkeypatch):
+    """Test that partial batch failures and a short result are reported."""
+    save_models(
+        [ModelConfig(name="gpt-3.5-turbo", provider="openai", model="gpt-3.5-turbo")],
+        temp_project_root,
+    )
+    monkeypatch.chdir(temp_project_root)
+    calls = []
+
+    async def flaky_acompletion(model, messages, **kwargs):
+        calls.append(1)
+        if len(calls) > 1:
+            raise RuntimeError("rate limited")
+        return _response(json.dumps({"input": "q", "completion": "a"}))
+
+    monkeypatch.setattr(litellm, "acompletion", flaky_acompletion)
+
+    result = runner.invoke(app, ["--count", "3", "--batch-size", "1", "--concurrency", "1"])
+    assert result.exit_code == 0, result.stdout
+    assert "2 of 3 batches failed" in result.stdout
+    assert "rate limited" in result.stdout
+    assert "Only 1 of 3 requested examples" in result.stdout
+
+
+def test_generate_sample_n_skips_empty_choices(temp_project_root: Path, monkeypatch):
+    """Test that a choice with content=None does not discard the rest of its batch."""
+    save_models(
+        [ModelConfig(name="gpt-3.5-turbo", provider="openai", model="gpt-3.5-turbo")],
+        temp_project_root,
+    )
+    monkeypatch.chdir(temp_project_root)
+
+    async def fake_acompletion(model, messages, n, **kwargs):
+        contents = [None, json.dumps({"input": "q", "completion": "a"})]
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=c)) for c in contents])
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+
+    result = runner.invoke(app, ["--count", "2", "--batch-size", "2", "--sample-n"])
+    assert result.exit_code == 0, result.stdout
+    assert "batches failed" not in result.stdout
+    lines = (temp_project_root / ".promptterfly" / "dataset.jsonl").read_text().splitlines()
+    assert [json.loads(line)["input"] for line in lines] == ["q"]
@@ -8,6 +8,7 @@ from promptterfly.core.models import (
     Version,
     ProjectConfig,
 )
+from promptterfly.models.registry import load_models, add_model, remove_model
 
 
 class TestModelConfig:
@@ -70,6 +71,12 @@ class TestModelConfig:
                 max_tokens=0
             )
 
+    def test_frozen(self):
+        """Test that ModelConfig instances are immutable."""
+        config = ModelConfig(name="test", provider="openai", model="gpt-4")
+        with pytest.raises(Exception):
+            config.temperature = 1.0
+
 
 class TestPrompt:
     """Tests for Prompt."""
@@ -190,3 +197,60 @@ class TestProjectConfig:
         assert config.auto_version is False
         assert config.default_model == "claude-3-opus"
         assert config.optimization["max_epochs"] == 20
+
+
+class TestModelRegistry:
+    """Tests for the cached model registry."""
+
+    def test_cached_load_reflects_changes(self, temp_project_root: Path):
+        """Test that repeat loads are cached but see adds, removes and edits."""
+        assert load_models(temp_project_root) == []
+        add_model(ModelConfig(name="a", provider="openai", model="gpt-4"), temp_project_root)
+        first = load_models(temp_project_root)
+        second = load_models(temp_project_root)
+        assert [m.name for m in first] == ["a"]
+        assert first == second and first is not second
+
+        remove_model("a", temp_project_root)
+        assert load_models(temp_project_root) == []
+
+        models_path = temp_project_root / ".promptterfly" / "models.yaml"
+        models_path.write_text("- name: edited\n  provider: anthropic\n  model: claude-3-opus\n")
+        assert [m.name for m in load_models(temp_project_root)] == ["edited"]
+
+
+@pytest.mark.parametrize("provider,model,expected", [
+    ("openai", "gpt-4", "openai/gpt-4"),
+    ("anthropic", "claude-3-opus", "anthropic/claude-3-opus"),
+    ("google", "gemini-pro", "gemini/gemini-pro"),
+    ("ollama", "llama3", "llama3"),
+])
+def test_litellm_model_str(provider, model, expected):
+    """Test provider-to-LiteLLM model string mapping."""
+    from promptterfly.models.registry import litellm_model_str
+    assert litellm_model_str(provider, model) == expected
+
+
+def test_llm_client_call_many(monkeypatch):
+    """Test that call_many returns responses in prompt order with bounded concurrency."""
+    import asyncio
+    from types import SimpleNamespace
+    import litellm
+    from promptterfly.models.client import LLMClient
+
+    active = []
+    peak = []
+
+    async def fake_acompletion(model, messages, **kwargs):
+        active.append(1)
+        peak.append(len(active))
+        await asyncio.sleep(0.01)
+        active.pop()
+        text = messages[0]["content"].upper()
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))])
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+    cfg = ModelConfig(name="m", provider="openai", model="gpt-4")
+    prompts = [f"p{i}" for i in range(6)]
+    assert LLMClient.call_many(prompts, cfg, concurrency=2) == [p.upper() for p in prompts]
+    assert max(peak) == 2
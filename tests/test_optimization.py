@@ -124,6 +124,74 @@ def test_optimize_creates_version_snapshot(opt_project, monkeypatch):
             engine_module.STRATEGIES["few_shot"] = original
 
 
+def test_optimize_in_memory_prompt(opt_project, monkeypatch):
+    """Test that a passed-in prompt is optimized without loading from disk."""
+    monkeypatch.chdir(opt_project["project_root"])
+    # Not saved to the store; optimize must use this object as-is
+    prompt = Prompt(
+        id=42,
+        name="Unsaved",
+        template="Draft {input}",
+        created_at=datetime(2023, 1, 1),
+        updated_at=datetime(2023, 1, 1),
+        model_name="test-model",
+    )
+    monkeypatch.setitem(STRATEGIES, "few_shot", lambda p, dataset, model_cfg: p.template + " v2")
+
+    new_prompt = optimize(prompt=prompt)
+    assert new_prompt.id == 42
+    assert new_prompt.template == "Draft {input} v2"
+
+
+def test_optimize_reuses_cached_result(opt_project, monkeypatch):
+    """Test that identical optimization runs are served from the on-disk cache."""
+    monkeypatch.chdir(opt_project["project_root"])
+    prompt = opt_project["store"].load_prompt(opt_project["prompt_id"])
+    prompt = prompt.model_copy(update={"model_name": "test-model"})
+    calls = []
+
+    def counting_few_shot(p, dataset, model_cfg):
+        calls.append(p.template)
+        return p.template + " v2"
+
+    monkeypatch.setitem(STRATEGIES, "few_shot", counting_few_shot)
+
+    first = optimize(prompt=prompt)
+    second = optimize(prompt=prompt)
+    assert first.template == second.template == prompt.template + " v2"
+    assert len(calls) == 1
+
+    optimize(prompt=prompt, use_cache=False)
+    assert len(calls) == 2
+
+    # A changed dataset is a different cache entry
+    dataset_file = opt_project["project_root"] / ".promptterfly" / "dataset.jsonl"
+    with open(dataset_file, "a") as f:
+        f.write(json.dumps({"input": "Bye", "completion": "Goodbye"}) + "\n")
+    optimize(prompt=prompt)
+    assert len(calls) == 3
+
+
+def test_optimize_streams_dataset_records(opt_project, monkeypatch):
+    """Test that the strategy receives every valid record, skipping junk lines."""
+    monkeypatch.chdir(opt_project["project_root"])
+    dataset_file = opt_project["project_root"] / ".promptterfly" / "dataset.jsonl"
+    with open(dataset_file, "a") as f:
+        f.write("not json\n\n")
+        f.write(json.dumps({"input": "Bye", "completion": "Goodbye"}) + "\n")
+    seen = []
+
+    def collecting_few_shot(p, dataset, model_cfg):
+        seen.extend(item["input"] for item in dataset)
+        return p.template + " v2"
+
+    monkeypatch.setitem(STRATEGIES, "few_shot", collecting_few_shot)
+
+    prompt = opt_project["store"].load_prompt(opt_project["prompt_id"])
+    optimize(prompt=prompt.model_copy(update={"model_name": "test-model"}), use_cache=False)
+    assert seen == ["Hello", "How are you?", "Bye"]
+
+
 def test_optimize_prompt_not_found(opt_project, monkeypatch):
     """Test optimize raises error if prompt not found."""
     project_root = opt_project["project_root"]
@@ -6,6 +6,7 @@ from pathlib import Path
 from promptterfly.storage.prompt_store import PromptStore
 from promptterfly.storage.version_store import VersionStore
 from promptterfly.core.models import Prompt
+from promptterfly.utils.io import ensure_line, set_dotenv_var, parse_dotenv_keys, find_project_root
 
 
 class TestPromptStore:
@@ -65,6 +66,51 @@ class TestPromptStore:
         ids = [p.id for p in listed]
         assert ids == [2, 1, 0]
 
+    def test_list_prompts_skips_invalid_files(self, populated_promptstore: PromptStore):
+        """Test that malformed or invalid prompt files are skipped."""
+        prompts_dir = populated_promptstore.prompts_dir
+        (prompts_dir / "2.json").write_text("{not json")
+        (prompts_dir / "3.json").write_text(json.dumps({"id": 3, "name": "No template"}))
+        listed = populated_promptstore.list_prompts()
+        assert [p.id for p in listed] == [1]
+
+    def test_list_prompts_many_files(self, temp_project_root: Path):
+        """Test that large cold listings (read in parallel) match file contents."""
+        store = PromptStore(temp_project_root)
+        for i in range(1, 21):
+            t = datetime(2023, 1, i)
+            store.save_prompt(Prompt(id=i, name=f"P{i}", template="T", created_at=t, updated_at=t))
+        (store.prompts_dir / "99.json").write_text("{not json")
+        listed = store.list_prompts()
+        assert [p.id for p in listed] == list(range(20, 0, -1))
+
+    def test_list_prompts_cache_returns_copies_and_sees_edits(self, populated_promptstore: PromptStore):
+        """Test that cached listings are independent copies and track file changes."""
+        first = populated_promptstore.list_prompts()
+        first[0].tags.append("mutated")
+        first[0].name = "Mutated"
+        second = populated_promptstore.list_prompts()
+        assert second[0].name == "Test Prompt"
+        assert "mutated" not in second[0].tags
+
+        path = populated_promptstore.get_prompt_path(1)
+        data = json.loads(path.read_text())
+        data["name"] = "Edited on disk"
+        path.write_text(json.dumps(data))
+        assert populated_promptstore.list_prompts()[0].name == "Edited on disk"
+
+    def test_save_prompt_invalidates_cache_despite_same_stat(self, populated_promptstore: PromptStore):
+        """Test that a same-size save with an unchanged mtime is not served from cache."""
+        import os
+        prompt = populated_promptstore.list_prompts()[0]
+        path = populated_promptstore.get_prompt_path(prompt.id)
+        st = path.stat()
+        populated_promptstore.save_prompt(prompt.model_copy(update={"name": "Tset Prompt"}))
+        # Simulate a coarse-mtime filesystem: same size, same timestamp
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert path.stat().st_size == st.st_size
+        assert populated_promptstore.list_prompts()[0].name == "Tset Prompt"
+
     def test_create_snapshot_creates_version_file(self, populated_promptstore: PromptStore, sample_prompt: Prompt):
         """Test that create_snapshot writes a version file."""
         vs = VersionStore(populated_promptstore.project_root)
@@ -99,6 +145,31 @@ class TestPromptStore:
         version_numbers = [v.version for v in versions]
         assert version_numbers == [1, 2, 3]
 
+    def test_create_snapshot_returns_version_and_uses_given_prompt(self, populated_promptstore: PromptStore, sample_prompt: Prompt):
+        """Test that create_snapshot returns the new version and can snapshot an in-memory prompt."""
+        store = populated_promptstore
+        assert store.create_snapshot(sample_prompt.id, "v1") == 1
+        assert store.create_snapshot(sample_prompt.id, "v2", prompt=sample_prompt) == 2
+        v2 = VersionStore(store.project_root).get_version_details(sample_prompt.id, 2)
+        assert v2.snapshot["template"] == sample_prompt.template
+
+    def test_create_snapshot_skip_unchanged(self, populated_promptstore: PromptStore, sample_prompt: Prompt):
+        """Test that skip_unchanged reuses the latest version when the prompt is identical."""
+        store = populated_promptstore
+        assert store.create_snapshot(sample_prompt.id, "v1") == 1
+        assert store.create_snapshot(sample_prompt.id, "again", skip_unchanged=True) == 1
+        changed = sample_prompt.model_copy(update={"template": "Changed {input}"})
+        store.save_prompt(changed)
+        assert store.create_snapshot(sample_prompt.id, "v2", skip_unchanged=True) == 2
+        assert len(VersionStore(store.project_root).list_versions(sample_prompt.id)) == 2
+
+    def test_prompt_exists(self, populated_promptstore: PromptStore, sample_prompt: Prompt):
+        """Test that prompt_exists checks the file without parsing it."""
+        assert populated_promptstore.prompt_exists(sample_prompt.id)
+        assert not populated_promptstore.prompt_exists(999)
+        populated_promptstore.get_prompt_path(2).write_text("{not json")
+        assert populated_promptstore.prompt_exists(2)
+
     def test_delete_prompt_removes_files(self, populated_promptstore: PromptStore, sample_prompt: Prompt):
         """Test deleting a prompt removes its JSON and versions."""
         store = populated_promptstore
@@ -203,3 +274,91 @@ class TestVersionStore:
 
         # Non-existent version returns None
         assert vs.get_version_details(prompt.id, 999) is None
+
+
+class TestDotfileHelpers:
+    """Tests for .gitignore / .env helpers in utils.io."""
+
+    def test_ensure_line(self, tmp_path: Path):
+        """Test that a line is added once and an existing file is preserved."""
+        path = tmp_path / ".gitignore"
+        path.write_text("*.pyc")
+        assert ensure_line(path, ".env") is True
+        assert ensure_line(path, ".env") is False
+        assert path.read_text() == "*.pyc\n.env\n"
+
+    def test_set_dotenv_var(self, tmp_path: Path):
+        """Test that existing keys are kept and new keys are appended."""
+        path = tmp_path / ".env"
+        assert set_dotenv_var(path, "OPENAI_API_KEY", "sk-1") is True
+        assert set_dotenv_var(path, "OPENAI_API_KEY", "sk-2") is False
+        assert set_dotenv_var(path, "ANTHROPIC_API_KEY", "sk-3") is True
+        assert path.read_text() == "OPENAI_API_KEY=sk-1\nANTHROPIC_API_KEY=sk-3\n"
+
+    def test_set_dotenv_var_creates_private_file(self, tmp_path: Path):
+        """Test that a new .env is owner-only and an existing one keeps its mode."""
+        import os
+        import stat
+        path = tmp_path / ".env"
+        set_dotenv_var(path, "OPENAI_API_KEY", "sk-1")
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+        shared = tmp_path / "shared.env"
+        shared.write_text("A=1")
+        os.chmod(shared, 0o644)
+        set_dotenv_var(shared, "B", "2")
+        assert stat.S_IMODE(os.stat(shared).st_mode) == 0o644
+        assert shared.read_text() == "A=1\nB=2\n"
+
+    def test_parse_dotenv_keys(self):
+        """Test that only whole keys count, ignoring comments and export prefixes."""
+        text = "# FOO_API_KEY=old\nPREFIX_FOO_API_KEY=a\nexport BAR_KEY = b\n\nnot a pair\n"
+        assert parse_dotenv_keys(text) == {"PREFIX_FOO_API_KEY", "BAR_KEY"}
+
+
+def test_find_project_root_memoized_until_cleared(tmp_path: Path):
+    """Test that root discovery is cached and cache_clear picks up a nearer project."""
+    outer = tmp_path / "outer"
+    inner = outer / "inner"
+    (outer / ".promptterfly").mkdir(parents=True)
+    inner.mkdir()
+    assert find_project_root(inner) == outer.resolve()
+    (inner / ".promptterfly").mkdir()
+    assert find_project_root(inner) == outer.resolve()
+    find_project_root.cache_clear()
+    assert find_project_root(inner) == inner.resolve()
+
+
+def test_model_catalog_serves_stale_and_refreshes(tmp_path: Path, monkeypatch):
+    """Test that a stale catalog is returned immediately and rebuilt in the background."""
+    import os
+    import sys
+    from types import SimpleNamespace
+    from promptterfly.utils import model_catalog
+
+    # Stand-in module: the real litellm import spawns a network retry thread
+    # that races the import itself when offline
+    litellm = SimpleNamespace(model_list=["openai/gpt-4o"])
+    monkeypatch.setitem(sys.modules, "litellm", litellm)
+    path = tmp_path / "models.json"
+    assert model_catalog.load_catalog(path) == {"openai": ["gpt-4o"]}
+    assert json.loads(path.read_text()) == {"openai": ["gpt-4o"]}
+
+    litellm.model_list = ["openai/gpt-5"]
+    assert model_catalog.load_catalog(path) == {"openai": ["gpt-4o"]}  # still fresh
+
+    old = path.stat().st_mtime - model_catalog.CATALOG_TTL - 1
+    os.utime(path, (old, old))
+    started = []
+
+    class FakeThread:
+        def __init__(self, target, args, daemon):
+            self.run = lambda: target(*args)
+
+        def start(self):
+            started.append(self)
+
+    monkeypatch.setattr(model_catalog.threading, "Thread", FakeThread)
+    assert model_catalog.load_catalog(path) == {"openai": ["gpt-4o"]}
+    started[0].run()
+    assert model_catalog.load_catalog(path) == {"openai": ["gpt-5"]}